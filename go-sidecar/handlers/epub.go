@@ -85,10 +85,16 @@ func HandleParseEpub(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// Helper to send SSE event
+	// Helper to send SSE event. The frame is assembled in one buffer and written
+	// once; the final event carries every chapter, so skipping fmt's formatting
+	// pass matters for large books.
 	sendEvent := func(event ProgressEvent) {
 		data, _ := json.Marshal(event)
-		fmt.Fprintf(w, "data: %s\n\n", data)
+		frame := make([]byte, 0, len(data)+8)
+		frame = append(frame, "data: "...)
+		frame = append(frame, data...)
+		frame = append(frame, "\n\n"...)
+		w.Write(frame)
 		flusher.Flush()
 	}
 
@@ -168,13 +174,15 @@ func HandleParseEpub(w http.ResponseWriter, r *http.Request) {
 
 	chapters := make([]Chapter, 0, len(spineChapters))
 	total := len(spineChapters)
+	lastProgress := -1
 
 	for i, ch := range spineChapters {
-		// Calculate progress (20-95%)
+		// Send a progress update (20-95%) only when the percentage moves, plus one
+		// for the last chapter. Large books would otherwise emit hundreds of
+		// identical frames, each forwarded to and re-rendered by the UI.
 		progress := 20 + int(float64(i+1)/float64(total)*75)
-
-		// Send progress update every 10 chapters or on last chapter
-		if i%10 == 0 || i == total-1 {
+		if progress != lastProgress || i == total-1 {
+			lastProgress = progress
 			sendEvent(ProgressEvent{
 				Type:    "progress",
 				Current: progress,
@@ -262,13 +270,18 @@ func respondWithError(w http.ResponseWriter, message string) {
 	})
 }
 
-// countWords counts words in a string
+// countWords counts words in a string.
+//
+// It scans bytes rather than decoding runes: the separators are all ASCII and
+// UTF-8 continuation bytes never collide with them, so the result is the same
+// without the per-rune decode cost on long chapter text.
 func countWords(s string) int {
 	words := 0
 	inWord := false
 
-	for _, r := range s {
-		isSpace := r == ' ' || r == '\n' || r == '\t' || r == '\r'
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		isSpace := c == ' ' || c == '\n' || c == '\t' || c == '\r'
 		if !isSpace && !inWord {
 			words++
 			inWord = true
@@ -15,10 +15,8 @@ function getDatabasePath(): string {
   const userDataPath = app.getPath('userData')
   const dbDir = join(userDataPath, 'data')
 
-  // Ensure directory exists
-  if (!existsSync(dbDir)) {
-    mkdirSync(dbDir, { recursive: true })
-  }
+  // Ensure directory exists (recursive mkdir is a no-op when it already does)
+  mkdirSync(dbDir, { recursive: true })
 
   return join(dbDir, 'noveltranslate.db')
 }
@@ -119,8 +117,12 @@ export function initDatabase(): Database.Database {
 
   db = new Database(dbPath)
 
-  // Enable foreign keys and WAL mode
+  // Enable foreign keys and WAL mode. With WAL, synchronous=NORMAL only syncs at
+  // checkpoints rather than on every commit, so saving a chapter doesn't wait on
+  // an fsync; commits still survive an app crash (only power loss can drop the
+  // last few)
   db.pragma('journal_mode = WAL')
+  db.pragma('synchronous = NORMAL')
   db.pragma('foreign_keys = ON')
 
   // Run schema setup
@@ -265,16 +265,18 @@ export function getNextAvailableKey(
  */
 export function hasValidKeys(providerConfigId: string): boolean {
   const db = getDatabase()
-  const result = db
+  // Stop at the first usable key rather than counting them all
+  const row = db
     .prepare(
       `
-    SELECT COUNT(*) as count FROM api_keys
+    SELECT 1 FROM api_keys
     WHERE provider_config_id = ? AND is_enabled = 1 AND is_valid = 1
+    LIMIT 1
   `
     )
-    .get(providerConfigId) as { count: number }
+    .get(providerConfigId)
 
-  return result.count > 0
+  return row !== undefined
 }
 
 // ============================================================================
@@ -1,5 +1,6 @@
 import type { Chapter, ChapterContent, ChapterStatus } from '../../../shared/types'
 import { generateId, getDatabase } from '../index'
+import { archiveTranslation } from './version.repository'
 
 /**
  * Create a new chapter
@@ -58,26 +59,22 @@ export function createChaptersBulk(
     VALUES (?, ?, NULL)
   `)
 
-  const insertMany = db.transaction((items: typeof chapters) => {
-    const results: Chapter[] = []
-
-    for (const item of items) {
+  const insertMany = db.transaction((items: typeof chapters) =>
+    items.map((item): Chapter => {
       const id = generateId()
       chapterStmt.run(id, projectId, item.spineIndex, item.title, now)
       contentStmt.run(id, item.sourceText)
 
-      results.push({
+      return {
         id,
         projectId,
         spineIndex: item.spineIndex,
         title: item.title,
         status: 'pending',
         createdAt: now,
-      })
-    }
-
-    return results
-  })
+      }
+    })
+  )
 
   return insertMany(chapters)
 }
@@ -113,6 +110,25 @@ export function listChapters(projectId: string): Chapter[] {
   return rows.map(rowToChapter)
 }
 
+/**
+ * Get the title and translated text of every translated chapter in a project,
+ * in spine order, with one query
+ */
+export function listTranslatedChapters(
+  projectId: string
+): Array<{ title: string; content: string }> {
+  const db = getDatabase()
+  const stmt = db.prepare(`
+    SELECT c.title, cc.translated_text AS content
+    FROM chapters c
+    JOIN chapter_content cc ON cc.chapter_id = c.id
+    WHERE c.project_id = ? AND cc.translated_text IS NOT NULL AND cc.translated_text != ''
+    ORDER BY c.spine_index ASC
+  `)
+
+  return stmt.all(projectId) as Array<{ title: string; content: string }>
+}
+
 /**
  * Get chapter content
  */
@@ -154,6 +170,20 @@ export function updateChapterStatus(
   stmt.run(status, errorMessage || null, id)
 }
 
+/**
+ * Return chapters left in 'translating' by a run that never finished (e.g. the
+ * app was closed mid-chapter) to 'pending', so the next run picks them up
+ */
+export function resetInterruptedChapters(): number {
+  const db = getDatabase()
+  const stmt = db.prepare(`
+    UPDATE chapters
+    SET status = 'pending', error_message = NULL
+    WHERE status = 'translating'
+  `)
+  return stmt.run().changes
+}
+
 /**
  * Update chapter translation
  */
@@ -167,6 +197,53 @@ export function updateChapterTranslation(chapterId: string, translatedText: stri
   stmt.run(translatedText, chapterId)
 }
 
+/**
+ * Store a finished translation and mark the chapter translated in one
+ * transaction, so a crash can't leave text saved under a stale status. When
+ * `archive` is given, the previous translation is versioned in the same
+ * transaction, so the whole save is a single commit.
+ */
+export function saveChapterTranslation(
+  chapterId: string,
+  translatedText: string,
+  archive?: {
+    previousText: string
+    configId: string
+    configName: string
+    providerConfigId: string
+    modelId: string
+  }
+): void {
+  const db = getDatabase()
+  const contentStmt = db.prepare(`
+    UPDATE chapter_content
+    SET translated_text = ?
+    WHERE chapter_id = ?
+  `)
+  const statusStmt = db.prepare(`
+    UPDATE chapters
+    SET status = 'translated', error_message = NULL
+    WHERE id = ?
+  `)
+
+  const save = db.transaction(() => {
+    if (archive) {
+      archiveTranslation(
+        chapterId,
+        archive.previousText,
+        archive.configId,
+        archive.configName,
+        archive.providerConfigId,
+        archive.modelId
+      )
+    }
+    contentStmt.run(translatedText, chapterId)
+    statusStmt.run(chapterId)
+  })
+
+  save()
+}
+
 /**
  * Update chapter title
  */
@@ -2,13 +2,14 @@ import type { Project, ProjectMetadata } from '../../../shared/types'
 import { generateId, getDatabase } from '../index'
 
 /**
- * Create a new project
+ * Create a new project, optionally seeding its metadata
  */
 export function createProject(
   name: string,
   sourcePath?: string,
   sourceLanguage = 'auto',
-  targetLanguage = 'en'
+  targetLanguage = 'en',
+  initialMetadata: Partial<ProjectMetadata> = {}
 ): Project {
   const db = getDatabase()
   const id = generateId()
@@ -16,6 +17,7 @@ export function createProject(
   const metadata: ProjectMetadata = {
     totalChapters: 0,
     translatedChapters: 0,
+    ...initialMetadata,
   }
 
   const stmt = db.prepare(`
@@ -19,20 +19,26 @@ const DEFAULT_SETTINGS: AppSettings = {
   enableFileLogging: false,
 }
 
+// Settings are read when each translation run starts (startTranslation and the
+// processJob worker pool), by batch tests to size their worker pool, and by the
+// settings IPC handlers. They only change through this module, so keep the
+// merged result instead of re-querying and re-parsing
+let cachedSettings: AppSettings | null = null
+
 /**
  * Get app settings
  */
 export function getSettings(): AppSettings {
+  if (cachedSettings) {
+    return { ...cachedSettings }
+  }
+
   const db = getDatabase()
   const stmt = db.prepare('SELECT value_json FROM app_settings WHERE key = ?')
   const row = stmt.get('settings') as { value_json: string } | undefined
 
-  if (!row) {
-    return DEFAULT_SETTINGS
-  }
-
-  const stored = JSON.parse(row.value_json)
-  return { ...DEFAULT_SETTINGS, ...stored }
+  cachedSettings = row ? { ...DEFAULT_SETTINGS, ...JSON.parse(row.value_json) } : DEFAULT_SETTINGS
+  return { ...cachedSettings }
 }
 
 /**
@@ -43,15 +49,22 @@ export function saveSettings(updates: Partial<AppSettings>): AppSettings {
   const current = getSettings()
   const updated = { ...current, ...updates }
 
+  // Settings UIs save on every change; skip the write when nothing differs
+  const serialized = JSON.stringify(updated)
+  if (serialized === JSON.stringify(current)) {
+    return updated
+  }
+
   const stmt = db.prepare(`
     INSERT INTO app_settings (key, value_json)
     VALUES ('settings', ?)
     ON CONFLICT(key) DO UPDATE SET value_json = excluded.value_json
   `)
 
-  stmt.run(JSON.stringify(updated))
+  stmt.run(serialized)
+  cachedSettings = updated
 
-  return updated
+  return { ...updated }
 }
 
 /**
@@ -76,6 +89,7 @@ export function resetSettings(): AppSettings {
   const db = getDatabase()
   const stmt = db.prepare('DELETE FROM app_settings WHERE key = ?')
   stmt.run('settings')
+  cachedSettings = null
   return DEFAULT_SETTINGS
 }
 
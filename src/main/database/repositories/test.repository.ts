@@ -98,7 +98,8 @@ export function deleteTestRun(id: string): void {
 // ============================================================================
 
 /**
- * Create a test result
+ * Create a test result. Results are listed by `createdAt`, so callers that save
+ * results out of order can pass one to keep their intended order.
  */
 export function createTestResult(
   testRunId: string,
@@ -114,11 +115,12 @@ export function createTestResult(
   durationMs: number,
   error: string | null,
   errorType: ErrorType | null,
-  executionPath: ChainExecutionStep[]
+  executionPath: ChainExecutionStep[],
+  createdAt?: string
 ): TestResult {
   const db = getDatabase()
   const id = generateId()
-  const now = new Date().toISOString()
+  const now = createdAt ?? new Date().toISOString()
 
   const stmt = db.prepare(`
     INSERT INTO test_results (
@@ -2,7 +2,7 @@ import { join } from 'node:path'
 import { electronApp, is, optimizer } from '@electron-toolkit/utils'
 import { app, BrowserWindow, session, shell } from 'electron'
 import icon from '../../resources/icon.png?asset'
-import { closeDatabase, initDatabase } from './database'
+import { closeDatabase, initDatabase, resetInterruptedChapters } from './database'
 import { registerIpcHandlers } from './ipc'
 import { logger } from './services/logger'
 import { startSidecar, stopSidecar } from './services/sidecar'
@@ -128,6 +128,13 @@ app.whenReady().then(async () => {
   try {
     initDatabase()
     logger.info('[Main] Database initialized')
+
+    // No translation job survives a restart, so any chapter still marked as
+    // translating was interrupted
+    const interrupted = resetInterruptedChapters()
+    if (interrupted > 0) {
+      logger.info(`[Main] Reset ${interrupted} interrupted chapters to pending`)
+    }
   } catch (error) {
     logger.error(
       '[Main] Failed to initialize database:',
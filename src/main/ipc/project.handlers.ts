@@ -5,11 +5,9 @@ import {
   createChaptersBulk,
   createProject,
   deleteProject,
-  getChapterContent,
   getProject,
-  listChapters,
   listProjects,
-  updateProjectMetadata,
+  listTranslatedChapters,
 } from '../database'
 import { logger } from '../services/logger'
 import { exportEpub, isSidecarConnected, parseEpub } from '../services/sidecar'
@@ -77,21 +75,16 @@ export function registerProjectHandlers(): void {
       }
     })
 
-    // Create project
-    const projectName = epubResult.metadata.title || basename(filePath, '.epub')
-    const project = createProject(projectName, filePath)
-
-    // Create chapters
     const chapters = epubResult.chapters.map((ch) => ({
       spineIndex: ch.spineIndex,
       title: ch.title,
       sourceText: ch.content,
     }))
 
-    createChaptersBulk(project.id, chapters)
-
-    // Update project metadata
-    updateProjectMetadata(project.id, {
+    // Create the project with its metadata in one write; the returned object
+    // already matches the stored row, so there's nothing to re-read
+    const projectName = epubResult.metadata.title || basename(filePath, '.epub')
+    const project = createProject(projectName, filePath, 'auto', 'en', {
       title: epubResult.metadata.title,
       author: epubResult.metadata.author,
       language: epubResult.metadata.language,
@@ -100,8 +93,9 @@ export function registerProjectHandlers(): void {
       translatedChapters: 0,
     })
 
-    // Return updated project
-    return getProject(project.id)!
+    createChaptersBulk(project.id, chapters)
+
+    return project
   })
 
   // Export project to EPUB
@@ -134,18 +128,7 @@ export function registerProjectHandlers(): void {
     }
 
     // Get all translated chapters
-    const chapters = listChapters(projectId)
-    const exportChapters: Array<{ title: string; content: string }> = []
-
-    for (const chapter of chapters) {
-      const content = getChapterContent(chapter.id)
-      if (content?.translatedText) {
-        exportChapters.push({
-          title: chapter.title,
-          content: content.translatedText,
-        })
-      }
-    }
+    const exportChapters = listTranslatedChapters(projectId)
 
     if (exportChapters.length === 0) {
       throw new Error('No translated chapters to export')
@@ -80,6 +80,8 @@ export function registerProviderConfigHandlers(): void {
   handleIpc('providerConfig:delete', (configId: string): void => {
     providerConfigService.deleteProviderConfig(configId)
     clearProviderCache(configId)
+    // The config's keys were deleted with it (ON DELETE CASCADE)
+    keyManager.clearKeyCache()
   })
 
   // Get models for a provider config (from config or template)
@@ -1,6 +1,6 @@
 import { BrowserWindow } from 'electron'
-import type { CostEstimate, TestRun } from '../../shared/types'
-import { createConfigSnapshot, getConfig } from '../database'
+import type { CostEstimate, TestResult, TestRun } from '../../shared/types'
+import { createConfigSnapshot, getConfig, getSettings } from '../database'
 import {
   addChapterToBatchTest,
   createTestResult,
@@ -101,7 +101,7 @@ export function registerTestHandlers(): void {
       const snapshot = createConfigSnapshot(configId as string, 'test')
 
       // Execute the translation
-      const startTime = Date.now()
+      const startTime = performance.now()
 
       try {
         const result = await executeChain({
@@ -128,7 +128,7 @@ export function registerTestHandlers(): void {
           result.tokensUsed.input,
           result.tokensUsed.output,
           result.totalCostUsd,
-          Date.now() - startTime,
+          Math.round(performance.now() - startTime),
           result.success ? null : result.finalError || 'Unknown error',
           result.success ? null : result.finalErrorType || null,
           result.executionPath
@@ -145,7 +145,7 @@ export function registerTestHandlers(): void {
           0,
           0,
           0,
-          Date.now() - startTime,
+          Math.round(performance.now() - startTime),
           String(error),
           'unknown',
           []
@@ -181,102 +181,117 @@ export function registerTestHandlers(): void {
         'comparison'
       )
 
-      // Run each config
-      for (const cfgId of configIds as string[]) {
-        const config = getConfig(cfgId)
-        if (!config) {
-          createTestResult(
-            testRun.id,
-            cfgId,
-            null,
-            'Unknown Config',
-            '',
-            '',
-            null,
-            0,
-            0,
-            0,
-            0,
-            `Config not found: ${cfgId}`,
-            'unknown',
-            []
-          )
-          continue
-        }
-
-        const apiKey = await keyManager.getKey(config.providerConfigId)
-        if (!apiKey) {
-          createTestResult(
-            testRun.id,
-            cfgId,
-            null,
-            config.name,
-            config.providerConfigId,
-            config.modelId,
-            null,
-            0,
-            0,
-            0,
-            0,
-            `No API key for provider: ${config.providerConfigId}`,
-            'auth_error',
-            []
-          )
-          continue
-        }
-
-        // Create snapshot
-        const snapshot = createConfigSnapshot(cfgId, 'test')
-
-        const startTime = Date.now()
-
-        try {
-          const result = await executeChain({
-            configId: cfgId,
-            sourceText: sampleText as string,
-            sourceLanguage: sourceLanguage as string,
-            targetLanguage: targetLanguage as string,
-            apiKey,
-            useMemory: false,
-            useGlossary: false,
-            window,
-          })
-
-          createTestResult(
-            testRun.id,
-            cfgId,
-            snapshot.id,
-            config.name,
-            config.providerConfigId,
-            config.modelId,
-            result.translatedText || null,
-            result.tokensUsed.input,
-            result.tokensUsed.output,
-            result.totalCostUsd,
-            Date.now() - startTime,
-            result.success ? null : result.finalError || null,
-            result.success ? null : result.finalErrorType || null,
-            result.executionPath
-          )
-        } catch (error) {
-          createTestResult(
-            testRun.id,
-            cfgId,
-            snapshot.id,
-            config.name,
-            config.providerConfigId,
-            config.modelId,
-            null,
-            0,
-            0,
-            0,
-            Date.now() - startTime,
-            String(error),
-            'unknown',
-            []
-          )
-        }
-      }
+      // Run the configs concurrently: they are independent requests, so the
+      // comparison takes as long as the slowest config instead of the sum of all
+      // of them. Each result is saved as soon as its config finishes, stamped
+      // with the run's start time plus its position so results still list in
+      // the order the configs were picked.
+      const startedAt = Date.now()
+      await Promise.all(
+        (configIds as string[]).map(async (cfgId, index): Promise<void> => {
+          const createdAt = new Date(startedAt + index).toISOString()
+          const config = getConfig(cfgId)
+          if (!config) {
+            createTestResult(
+              testRun.id,
+              cfgId,
+              null,
+              'Unknown Config',
+              '',
+              '',
+              null,
+              0,
+              0,
+              0,
+              0,
+              `Config not found: ${cfgId}`,
+              'unknown',
+              [],
+              createdAt
+            )
+            return
+          }
+
+          const apiKey = await keyManager.getKey(config.providerConfigId)
+          if (!apiKey) {
+            createTestResult(
+              testRun.id,
+              cfgId,
+              null,
+              config.name,
+              config.providerConfigId,
+              config.modelId,
+              null,
+              0,
+              0,
+              0,
+              0,
+              `No API key for provider: ${config.providerConfigId}`,
+              'auth_error',
+              [],
+              createdAt
+            )
+            return
+          }
+
+          // Create snapshot
+          const snapshot = createConfigSnapshot(cfgId, 'test')
+
+          const startTime = performance.now()
+
+          try {
+            const result = await executeChain({
+              configId: cfgId,
+              sourceText: sampleText as string,
+              sourceLanguage: sourceLanguage as string,
+              targetLanguage: targetLanguage as string,
+              apiKey,
+              useMemory: false,
+              useGlossary: false,
+              window,
+            })
+            const durationMs = Math.round(performance.now() - startTime)
+
+            createTestResult(
+              testRun.id,
+              cfgId,
+              snapshot.id,
+              config.name,
+              config.providerConfigId,
+              config.modelId,
+              result.translatedText || null,
+              result.tokensUsed.input,
+              result.tokensUsed.output,
+              result.totalCostUsd,
+              durationMs,
+              result.success ? null : result.finalError || null,
+              result.success ? null : result.finalErrorType || null,
+              result.executionPath,
+              createdAt
+            )
+          } catch (error) {
+            const durationMs = Math.round(performance.now() - startTime)
+
+            createTestResult(
+              testRun.id,
+              cfgId,
+              snapshot.id,
+              config.name,
+              config.providerConfigId,
+              config.modelId,
+              null,
+              0,
+              0,
+              0,
+              durationMs,
+              String(error),
+              'unknown',
+              [],
+              createdAt
+            )
+          }
+        })
+      )
 
       return getTestRunWithResults(testRun.id)!
     }
@@ -327,72 +342,80 @@ export function registerTestHandlers(): void {
       // Create snapshot
       const snapshot = createConfigSnapshot(configId as string, 'test')
 
-      // Run each chapter
-      for (let i = 0; i < chapters.length; i++) {
-        const chapter = chapters[i]
-
-        // Emit progress
-        window?.webContents.send('test:batchProgress', {
-          testRunId: testRun.id,
-          current: i + 1,
-          total: chapters.length,
-          chapterId: chapter.chapterId,
-        })
-
-        const startTime = Date.now()
-
-        try {
-          const result = await executeChain({
-            configId: configId as string,
-            sourceText: chapter.text,
-            sourceLanguage: sourceLanguage as string,
-            targetLanguage: targetLanguage as string,
-            apiKey,
-            useMemory: false,
-            useGlossary: false,
-            window,
-          })
-
-          const testResult = createTestResult(
-            testRun.id,
-            configId as string,
-            snapshot.id,
-            config.name,
-            config.providerConfigId,
-            config.modelId,
-            result.translatedText || null,
-            result.tokensUsed.input,
-            result.tokensUsed.output,
-            result.totalCostUsd,
-            Date.now() - startTime,
-            result.success ? null : result.finalError || null,
-            result.success ? null : result.finalErrorType || null,
-            result.executionPath
-          )
-
+      // Run chapters through a small worker pool, like translation runs do, so a
+      // batch takes about total / concurrency round trips instead of one per
+      // chapter. Each result is saved and linked to its chapter as soon as it
+      // finishes, so an interrupted batch keeps the results it already paid for.
+      let nextIndex = 0
+      let completed = 0
+      const worker = async (): Promise<void> => {
+        while (nextIndex < chapters.length) {
+          const chapter = chapters[nextIndex++]
+          const startTime = performance.now()
+
+          let testResult: TestResult
+          try {
+            const result = await executeChain({
+              configId: configId as string,
+              sourceText: chapter.text,
+              sourceLanguage: sourceLanguage as string,
+              targetLanguage: targetLanguage as string,
+              apiKey,
+              useMemory: false,
+              useGlossary: false,
+              window,
+            })
+
+            testResult = createTestResult(
+              testRun.id,
+              configId as string,
+              snapshot.id,
+              config.name,
+              config.providerConfigId,
+              config.modelId,
+              result.translatedText || null,
+              result.tokensUsed.input,
+              result.tokensUsed.output,
+              result.totalCostUsd,
+              Math.round(performance.now() - startTime),
+              result.success ? null : result.finalError || null,
+              result.success ? null : result.finalErrorType || null,
+              result.executionPath
+            )
+          } catch (error) {
+            testResult = createTestResult(
+              testRun.id,
+              configId as string,
+              snapshot.id,
+              config.name,
+              config.providerConfigId,
+              config.modelId,
+              null,
+              0,
+              0,
+              0,
+              Math.round(performance.now() - startTime),
+              String(error),
+              'unknown',
+              []
+            )
+          }
           linkResultToBatchChapter(testRun.id, chapter.chapterId, testResult.id)
-        } catch (error) {
-          const testResult = createTestResult(
-            testRun.id,
-            configId as string,
-            snapshot.id,
-            config.name,
-            config.providerConfigId,
-            config.modelId,
-            null,
-            0,
-            0,
-            0,
-            Date.now() - startTime,
-            String(error),
-            'unknown',
-            []
-          )
 
-          linkResultToBatchChapter(testRun.id, chapter.chapterId, testResult.id)
+          // Report completed chapters, so the bar only fills as results land
+          completed++
+          window?.webContents.send('test:batchProgress', {
+            testRunId: testRun.id,
+            current: completed,
+            total: chapters.length,
+            chapterId: chapter.chapterId,
+          })
         }
       }
 
+      const concurrency = Math.min(getSettings().translationConcurrency, chapters.length)
+      await Promise.all(Array.from({ length: Math.max(1, concurrency) }, () => worker()))
+
       return getTestRunWithResults(testRun.id)!
     }
   )
@@ -1,5 +1,7 @@
-import Anthropic from '@anthropic-ai/sdk'
+import type Anthropic from '@anthropic-ai/sdk'
 import type { ModelInfo, ProviderSettings } from '../../shared/types'
+import { ClientCache } from './client-cache'
+import { loadAnthropicSdk } from './sdk-loader'
 import {
   describeProviderError,
   type ProviderTranslationRequest,
@@ -13,6 +15,11 @@ export class AnthropicProvider implements TranslationProvider {
   private baseUrl?: string
   private settings: ProviderSettings = {}
 
+  // SDK clients for translate() by API key and base URL. Reusing a client across
+  // chapters and runs keeps its connections alive instead of reconnecting per call.
+  // Idle clients expire, and all are dropped when stored keys change.
+  private clients = new ClientCache<Anthropic>()
+
   /**
    * Configure the provider with custom base URL and settings
    */
@@ -21,24 +28,22 @@ export class AnthropicProvider implements TranslationProvider {
     if (settings) {
       this.settings = settings
     }
+    this.clients.clear()
   }
 
   async translate(request: ProviderTranslationRequest): Promise<ProviderTranslationResult> {
-    const client = new Anthropic({
-      apiKey: request.apiKey,
-      baseURL: request.baseUrl || this.baseUrl,
-      timeout: this.settings.timeout,
-      defaultHeaders: this.settings.customHeaders,
-    })
-
     try {
-      const response = await client.messages.create({
-        model: request.modelId,
-        system: request.systemPrompt,
-        messages: [{ role: 'user', content: request.userPrompt }],
-        temperature: request.temperature,
-        max_tokens: request.maxTokens || 4096,
-      })
+      const client = await this.getClient(request.apiKey, request.baseUrl || this.baseUrl)
+      const response = await client.messages.create(
+        {
+          model: request.modelId,
+          system: request.systemPrompt,
+          messages: [{ role: 'user', content: request.userPrompt }],
+          temperature: request.temperature,
+          max_tokens: request.maxTokens || 4096,
+        },
+        { signal: request.signal }
+      )
 
       const textContent = response.content.find((c) => c.type === 'text')
       const text = textContent?.type === 'text' ? textContent.text : ''
@@ -58,17 +63,31 @@ export class AnthropicProvider implements TranslationProvider {
         tokensUsed: { input: 0, output: 0, total: 0 },
         finishReason: 'error',
         error: error instanceof Error ? error.message : String(error),
+        cause: error,
       }
     }
   }
 
+  private getClient(apiKey: string, baseURL?: string): Promise<Anthropic> {
+    return this.clients.get(apiKey, baseURL ?? '', async () => {
+      const sdk = await loadAnthropicSdk()
+      return new sdk.Anthropic({
+        apiKey,
+        baseURL,
+        timeout: this.settings.timeout,
+        defaultHeaders: this.settings.customHeaders,
+      })
+    })
+  }
+
   estimateTokens(text: string, _modelId: string): number {
     // Rough estimation for Anthropic
     return Math.ceil(text.length / 4)
   }
 
   async validateKey(key: string, baseUrl?: string): Promise<boolean> {
-    const client = new Anthropic({
+    const sdk = await loadAnthropicSdk()
+    const client = new sdk.Anthropic({
       apiKey: key,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout,
@@ -84,7 +103,8 @@ export class AnthropicProvider implements TranslationProvider {
   }
 
   async listModels(apiKey: string, baseUrl?: string): Promise<ModelInfo[]> {
-    const client = new Anthropic({
+    const sdk = await loadAnthropicSdk()
+    const client = new sdk.Anthropic({
       apiKey,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout,
@@ -0,0 +1,95 @@
+/**
+ * Provider SDK Client Cache
+ *
+ * Providers reuse one SDK client per API key so connections stay alive across
+ * chapters and runs. A client holds its key in plaintext, so entries are keyed
+ * by a hash of the key, expire after a few idle minutes (like KeyManager's
+ * decrypted keys), and are dropped whenever stored keys change.
+ */
+
+import { createHash } from 'node:crypto'
+
+// How long an unused client is kept before it is dropped
+const CLIENT_IDLE_TTL_MS = 5 * 60 * 1000
+
+// Caches currently holding clients, so key changes can evict them across all
+// provider instances. Empty caches aren't tracked, so dropped providers aren't kept alive.
+const activeCaches = new Set<ClientCache<unknown>>()
+
+/**
+ * Idle-expiring cache of SDK clients by API key
+ */
+export class ClientCache<T> {
+  private entries = new Map<string, { client: Promise<T>; expiresAt: number }>()
+  private sweepTimer: NodeJS.Timeout | null = null
+
+  /**
+   * Get the client for `apiKey` (and `scope`, e.g. a base URL), creating it on
+   * first use or after it expired
+   */
+  get(apiKey: string, scope: string, create: () => Promise<T>): Promise<T> {
+    const cacheKey = createHash('sha256').update(`${scope}\n${apiKey}`).digest('hex')
+    const now = performance.now()
+    const entry = this.entries.get(cacheKey)
+    if (entry && entry.expiresAt > now) {
+      entry.expiresAt = now + CLIENT_IDLE_TTL_MS
+      return entry.client
+    }
+
+    // Cache the pending client, so requests that miss at the same time (e.g. a
+    // run's first chapters) share one client instead of each building their own
+    const client = create()
+    this.entries.set(cacheKey, { client, expiresAt: now + CLIENT_IDLE_TTL_MS })
+    this.scheduleSweep()
+    client.catch(() => {
+      // Don't keep a failed creation around; the next request tries again
+      if (this.entries.get(cacheKey)?.client === client) {
+        this.entries.delete(cacheKey)
+      }
+    })
+    return client
+  }
+
+  /**
+   * Drop all clients
+   */
+  clear(): void {
+    this.entries.clear()
+    activeCaches.delete(this)
+    if (this.sweepTimer) {
+      clearInterval(this.sweepTimer)
+      this.sweepTimer = null
+    }
+  }
+
+  // Expired entries are removed on a timer, not just when read again, so a key
+  // that stops being used doesn't keep its client around
+  private scheduleSweep(): void {
+    if (this.sweepTimer) {
+      return
+    }
+    activeCaches.add(this)
+    this.sweepTimer = setInterval(() => {
+      const now = performance.now()
+      for (const [cacheKey, entry] of this.entries) {
+        if (entry.expiresAt <= now) {
+          this.entries.delete(cacheKey)
+        }
+      }
+      if (this.entries.size === 0) {
+        this.clear()
+      }
+    }, CLIENT_IDLE_TTL_MS)
+    this.sweepTimer.unref()
+  }
+}
+
+/**
+ * Drop the cached clients of every provider, e.g. after an API key was updated
+ * or removed
+ */
+export function clearProviderClients(): void {
+  for (const cache of activeCaches) {
+    cache.clear()
+  }
+}
@@ -1,5 +1,7 @@
-import { GoogleGenerativeAI } from '@google/generative-ai'
+import type { GoogleGenerativeAI } from '@google/generative-ai'
 import type { ModelInfo, ProviderSettings } from '../../shared/types'
+import { ClientCache } from './client-cache'
+import { loadGeminiSdk } from './sdk-loader'
 import {
   describeProviderError,
   type ProviderTranslationRequest,
@@ -15,6 +17,11 @@ export class GeminiProvider implements TranslationProvider {
   private baseUrl?: string
   private settings: ProviderSettings = {}
 
+  // SDK clients for translate() by API key, matching the other providers (idle
+  // clients expire and are dropped when stored keys change). The model itself is
+  // built per request since it carries the system prompt.
+  private clients = new ClientCache<GoogleGenerativeAI>()
+
   /**
    * Configure the provider with custom settings
    * Note: Google Generative AI SDK has limited base URL support
@@ -24,33 +31,38 @@ export class GeminiProvider implements TranslationProvider {
     if (settings) {
       this.settings = settings
     }
+    this.clients.clear()
   }
 
   async translate(request: ProviderTranslationRequest): Promise<ProviderTranslationResult> {
-    const genAI = new GoogleGenerativeAI(request.apiKey)
     const baseUrl = request.baseUrl || this.baseUrl
-    const model = genAI.getGenerativeModel(
-      {
-        model: request.modelId,
-        systemInstruction: request.systemPrompt,
-      },
-      {
-        baseUrl,
-        timeout: this.settings.timeout,
-        customHeaders: this.settings.customHeaders
-          ? new Headers(this.settings.customHeaders)
-          : undefined,
-      }
-    )
 
     try {
-      const result = await model.generateContent({
-        contents: [{ role: 'user', parts: [{ text: request.userPrompt }] }],
-        generationConfig: {
-          temperature: request.temperature,
-          maxOutputTokens: request.maxTokens,
+      const genAI = await this.getClient(request.apiKey)
+      const model = genAI.getGenerativeModel(
+        {
+          model: request.modelId,
+          systemInstruction: request.systemPrompt,
         },
-      })
+        {
+          baseUrl,
+          timeout: this.settings.timeout,
+          customHeaders: this.settings.customHeaders
+            ? new Headers(this.settings.customHeaders)
+            : undefined,
+        }
+      )
+
+      const result = await model.generateContent(
+        {
+          contents: [{ role: 'user', parts: [{ text: request.userPrompt }] }],
+          generationConfig: {
+            temperature: request.temperature,
+            maxOutputTokens: request.maxTokens,
+          },
+        },
+        { signal: request.signal }
+      )
 
       const response = result.response
       const text = response.text()
@@ -71,10 +83,18 @@ export class GeminiProvider implements TranslationProvider {
         tokensUsed: { input: 0, output: 0, total: 0 },
         finishReason: 'error',
         error: error instanceof Error ? error.message : String(error),
+        cause: error,
       }
     }
   }
 
+  private getClient(apiKey: string): Promise<GoogleGenerativeAI> {
+    return this.clients.get(apiKey, '', async () => {
+      const sdk = await loadGeminiSdk()
+      return new sdk.GoogleGenerativeAI(apiKey)
+    })
+  }
+
   estimateTokens(text: string, _modelId: string): number {
     // Rough estimation for Gemini
     return Math.ceil(text.length / 4)
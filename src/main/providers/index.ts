@@ -7,6 +7,7 @@ import { OpenAICompatibleProvider } from './openai-compatible.provider'
 import { providerConfigService } from './provider-config.service'
 import { providerRegistry, type TranslationProvider } from './types'
 
+export * from './client-cache'
 export * from './openai-compatible.provider'
 export * from './provider-config.service'
 export * from './types'
@@ -1,5 +1,7 @@
-import OpenAI from 'openai'
+import type OpenAI from 'openai'
 import type { ModelInfo, ProviderSettings } from '../../shared/types'
+import { ClientCache } from './client-cache'
+import { loadOpenAISdk } from './sdk-loader'
 import {
   describeProviderError,
   type ProviderTranslationRequest,
@@ -17,6 +19,11 @@ export class OpenAICompatibleProvider implements TranslationProvider {
   private baseUrl: string
   private settings: ProviderSettings
 
+  // SDK clients for translate() by API key. Reusing a client across chapters and
+  // runs keeps its connections alive instead of reconnecting per call. Idle
+  // clients expire, and all are dropped when stored keys change.
+  private clients = new ClientCache<OpenAI>()
+
   constructor(id: string, name: string, baseUrl: string, settings: ProviderSettings = {}) {
     this.id = id
     this.name = name
@@ -34,27 +41,24 @@ export class OpenAICompatibleProvider implements TranslationProvider {
     if (settings) {
       this.settings = { ...this.settings, ...settings }
     }
+    this.clients.clear()
   }
 
   async translate(request: ProviderTranslationRequest): Promise<ProviderTranslationResult> {
-    const client = new OpenAI({
-      apiKey: request.apiKey,
-      baseURL: this.baseUrl,
-      timeout: this.settings.timeout || 60000,
-      defaultHeaders: this.settings.customHeaders,
-      organization: this.settings.organizationId,
-    })
-
     try {
-      const response = await client.chat.completions.create({
-        model: request.modelId,
-        messages: [
-          { role: 'system', content: request.systemPrompt },
-          { role: 'user', content: request.userPrompt },
-        ],
-        temperature: request.temperature,
-        max_tokens: request.maxTokens,
-      })
+      const client = await this.getClient(request.apiKey)
+      const response = await client.chat.completions.create(
+        {
+          model: request.modelId,
+          messages: [
+            { role: 'system', content: request.systemPrompt },
+            { role: 'user', content: request.userPrompt },
+          ],
+          temperature: request.temperature,
+          max_tokens: request.maxTokens,
+        },
+        { signal: request.signal }
+      )
 
       const choice = response.choices[0]
       const usage = response.usage
@@ -74,17 +78,32 @@ export class OpenAICompatibleProvider implements TranslationProvider {
         tokensUsed: { input: 0, output: 0, total: 0 },
         finishReason: 'error',
         error: error instanceof Error ? error.message : String(error),
+        cause: error,
       }
     }
   }
 
+  private getClient(apiKey: string): Promise<OpenAI> {
+    return this.clients.get(apiKey, this.baseUrl, async () => {
+      const sdk = await loadOpenAISdk()
+      return new sdk.OpenAI({
+        apiKey,
+        baseURL: this.baseUrl,
+        timeout: this.settings.timeout || 60000,
+        defaultHeaders: this.settings.customHeaders,
+        organization: this.settings.organizationId,
+      })
+    })
+  }
+
   estimateTokens(text: string, _modelId: string): number {
     // Rough estimation: ~4 characters per token for English
     return Math.ceil(text.length / 4)
   }
 
   async validateKey(key: string, baseUrl?: string): Promise<boolean> {
-    const client = new OpenAI({
+    const sdk = await loadOpenAISdk()
+    const client = new sdk.OpenAI({
       apiKey: key,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout || 30000,
@@ -115,7 +134,8 @@ export class OpenAICompatibleProvider implements TranslationProvider {
    * Fetch available models from the provider API
    */
   async listModels(apiKey: string, baseUrl?: string): Promise<ModelInfo[]> {
-    const client = new OpenAI({
+    const sdk = await loadOpenAISdk()
+    const client = new sdk.OpenAI({
       apiKey,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout || 30000,
@@ -150,7 +170,8 @@ export class OpenAICompatibleProvider implements TranslationProvider {
     apiKey: string,
     baseUrl?: string
   ): Promise<{ valid: boolean; error?: string; models?: number }> {
-    const client = new OpenAI({
+    const sdk = await loadOpenAISdk()
+    const client = new sdk.OpenAI({
       apiKey,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout || 30000,
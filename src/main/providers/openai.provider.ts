@@ -1,5 +1,7 @@
-import OpenAI from 'openai'
+import type OpenAI from 'openai'
 import type { ModelInfo, ProviderSettings } from '../../shared/types'
+import { ClientCache } from './client-cache'
+import { loadOpenAISdk } from './sdk-loader'
 import {
   describeProviderError,
   type ProviderTranslationRequest,
@@ -13,6 +15,11 @@ export class OpenAIProvider implements TranslationProvider {
   private baseUrl?: string
   private settings: ProviderSettings = {}
 
+  // SDK clients for translate() by API key and base URL. Reusing a client across
+  // chapters and runs keeps its connections alive instead of reconnecting per call.
+  // Idle clients expire, and all are dropped when stored keys change.
+  private clients = new ClientCache<OpenAI>()
+
   /**
    * Configure the provider with custom base URL and settings
    */
@@ -21,27 +28,24 @@ export class OpenAIProvider implements TranslationProvider {
     if (settings) {
       this.settings = settings
     }
+    this.clients.clear()
   }
 
   async translate(request: ProviderTranslationRequest): Promise<ProviderTranslationResult> {
-    const client = new OpenAI({
-      apiKey: request.apiKey,
-      baseURL: request.baseUrl || this.baseUrl,
-      timeout: this.settings.timeout,
-      organization: this.settings.organizationId,
-      defaultHeaders: this.settings.customHeaders,
-    })
-
     try {
-      const response = await client.chat.completions.create({
-        model: request.modelId,
-        messages: [
-          { role: 'system', content: request.systemPrompt },
-          { role: 'user', content: request.userPrompt },
-        ],
-        temperature: request.temperature,
-        max_tokens: request.maxTokens,
-      })
+      const client = await this.getClient(request.apiKey, request.baseUrl || this.baseUrl)
+      const response = await client.chat.completions.create(
+        {
+          model: request.modelId,
+          messages: [
+            { role: 'system', content: request.systemPrompt },
+            { role: 'user', content: request.userPrompt },
+          ],
+          temperature: request.temperature,
+          max_tokens: request.maxTokens,
+        },
+        { signal: request.signal }
+      )
 
       const choice = response.choices[0]
       const usage = response.usage
@@ -61,10 +65,24 @@ export class OpenAIProvider implements TranslationProvider {
         tokensUsed: { input: 0, output: 0, total: 0 },
         finishReason: 'error',
         error: error instanceof Error ? error.message : String(error),
+        cause: error,
       }
     }
   }
 
+  private getClient(apiKey: string, baseURL?: string): Promise<OpenAI> {
+    return this.clients.get(apiKey, baseURL ?? '', async () => {
+      const sdk = await loadOpenAISdk()
+      return new sdk.OpenAI({
+        apiKey,
+        baseURL,
+        timeout: this.settings.timeout,
+        organization: this.settings.organizationId,
+        defaultHeaders: this.settings.customHeaders,
+      })
+    })
+  }
+
   estimateTokens(text: string, _modelId: string): number {
     // Rough estimation: ~4 characters per token for English
     // This is approximate; for precise counts, use tiktoken
@@ -72,7 +90,8 @@ export class OpenAIProvider implements TranslationProvider {
   }
 
   async validateKey(key: string, baseUrl?: string): Promise<boolean> {
-    const client = new OpenAI({
+    const sdk = await loadOpenAISdk()
+    const client = new sdk.OpenAI({
       apiKey: key,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout,
@@ -89,7 +108,8 @@ export class OpenAIProvider implements TranslationProvider {
   }
 
   async listModels(apiKey: string, baseUrl?: string): Promise<ModelInfo[]> {
-    const client = new OpenAI({
+    const sdk = await loadOpenAISdk()
+    const client = new sdk.OpenAI({
       apiKey,
       baseURL: baseUrl || this.baseUrl,
       timeout: this.settings.timeout,
@@ -6,7 +6,6 @@ import type {
   ProviderInfoExtended,
   ProviderSettings,
 } from '../../shared/types'
-import { hasValidKeys } from '../database/repositories/apikey.repository'
 import {
   createProviderConfig,
   deleteProviderConfig,
@@ -308,6 +307,11 @@ const BUILTIN_TEMPLATES: BuiltinProviderTemplate[] = [
   },
 ]
 
+// Templates keyed by ID; looked up on every SDK/base-URL/model resolution
+const BUILTIN_TEMPLATES_BY_ID = new Map<BuiltinProviderId, BuiltinProviderTemplate>(
+  BUILTIN_TEMPLATES.map((t) => [t.id, t])
+)
+
 // ============================================================================
 // Provider Config Service
 // ============================================================================
@@ -324,7 +328,7 @@ class ProviderConfigService {
    * Get a specific built-in template
    */
   getBuiltinTemplate(id: BuiltinProviderId): BuiltinProviderTemplate | null {
-    return BUILTIN_TEMPLATES.find((t) => t.id === id) || null
+    return BUILTIN_TEMPLATES_BY_ID.get(id) || null
   }
 
   /**
@@ -443,7 +447,7 @@ class ProviderConfigService {
       builtinId: config.builtinId,
       baseUrl: config.baseUrl,
       isEnabled: config.isEnabled,
-      hasValidKey: hasValidKeys(config.id),
+      hasValidKey: stats.validKeyCount > 0,
       keyCount: stats.keyCount,
       totalRequests: stats.totalRequests,
     }
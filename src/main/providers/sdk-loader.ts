@@ -0,0 +1,35 @@
+/**
+ * Provider SDK Loaders
+ *
+ * SDKs are imported on first use instead of at startup, so launching the app
+ * doesn't load client libraries for providers that are never called. Each
+ * loader caches its import, so later calls resolve immediately.
+ */
+
+let openaiSdk: Promise<typeof import('openai')> | undefined
+let anthropicSdk: Promise<typeof import('@anthropic-ai/sdk')> | undefined
+let geminiSdk: Promise<typeof import('@google/generative-ai')> | undefined
+
+/**
+ * Load the OpenAI SDK (also used by OpenAI-compatible providers)
+ */
+export function loadOpenAISdk(): Promise<typeof import('openai')> {
+  openaiSdk ??= import('openai')
+  return openaiSdk
+}
+
+/**
+ * Load the Anthropic SDK
+ */
+export function loadAnthropicSdk(): Promise<typeof import('@anthropic-ai/sdk')> {
+  anthropicSdk ??= import('@anthropic-ai/sdk')
+  return anthropicSdk
+}
+
+/**
+ * Load the Google Generative AI SDK
+ */
+export function loadGeminiSdk(): Promise<typeof import('@google/generative-ai')> {
+  geminiSdk ??= import('@google/generative-ai')
+  return geminiSdk
+}
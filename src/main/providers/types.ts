@@ -60,6 +60,8 @@ export interface ProviderTranslationRequest {
   apiKey: string
   /** Optional base URL override for this request (custom/compatible endpoints) */
   baseUrl?: string
+  /** Aborts the request in flight, e.g. when the translation run is cancelled */
+  signal?: AbortSignal
 }
 
 export interface ProviderTranslationResult {
@@ -71,6 +73,11 @@ export interface ProviderTranslationResult {
   }
   finishReason: 'stop' | 'length' | 'error'
   error?: string
+  /**
+   * The original SDK error behind `error`, kept so retry handling can read its
+   * status code, headers and retry hints
+   */
+  cause?: unknown
 }
 
 /**
@@ -12,6 +12,7 @@ import type {
   ConfigFallback,
   ErrorType,
   GlossaryTerm,
+  ProviderConfig,
   RetryConfig,
   TranslationConfig,
 } from '../../shared/types'
@@ -33,8 +34,14 @@ import { getProviderByConfigId } from '../providers'
 import { providerConfigService } from '../providers/provider-config.service'
 import { getModelPricing } from './cost-estimator'
 import { type ClassificationResult, classifyError } from './error-classifier'
+import { keyManager } from './key-manager'
 import { logger } from './logger'
-import { DEFAULT_RETRY_CONFIG, executeWithRetry } from './retry-strategy'
+import {
+  DEFAULT_RETRY_CONFIG,
+  executeWithRetry,
+  startCooldown,
+  waitForCooldown,
+} from './retry-strategy'
 
 export interface ChainExecutorOptions {
   /** The starting config ID */
@@ -45,8 +52,17 @@ export interface ChainExecutorOptions {
   sourceLanguage: string
   /** Target language */
   targetLanguage: string
-  /** API key to use */
+  /** API key for the starting config's provider */
   apiKey: string
+  /**
+   * Keys for fallback configs on other providers, looked up on first use. Pass
+   * the same map across calls (e.g. for a whole translation run) to reuse them.
+   */
+  apiKeys?: Map<string, string>
+  /** Config lookups shared across a run's chapters (see createChainRunCache) */
+  runCache?: ChainRunCache
+  /** Aborted when the caller cancels; stops further retries and fallbacks */
+  signal?: AbortSignal
   /** Project ID (for glossary, memory, budget) */
   projectId?: string
   /** Chapter ID, when translating a chapter (for usage attribution) */
@@ -65,15 +81,126 @@ export interface ChainExecutorOptions {
   window?: BrowserWindow
 }
 
+/**
+ * Configs, provider configs, and fallback lists resolved during a translation
+ * run. Each is read from the database once and reused for the run's remaining
+ * chapters; edits made mid-run apply from the next run.
+ */
+export interface ChainRunCache {
+  configs: Map<string, TranslationConfig | null>
+  providerConfigs: Map<string, ProviderConfig | null>
+  fallbacks: Map<string, ConfigFallback[]>
+}
+
+/**
+ * Create an empty cache for one translation run
+ */
+export function createChainRunCache(): ChainRunCache {
+  return { configs: new Map(), providerConfigs: new Map(), fallbacks: new Map() }
+}
+
 /**
  * Maximum chain depth to prevent infinite loops
  */
 const MAX_CHAIN_DEPTH = 10
 
 /**
- * Execute a translation with fallback chain support
+ * Live translations in flight, by source text and the settings that shape the
+ * result. Only used with translation memory on, where a repeat would be served
+ * from memory anyway once the first call finishes.
+ */
+const inflightTranslations = new Map<string, Promise<ChainExecutionResult>>()
+
+/**
+ * Execute a translation with fallback chain support. A request for text that is
+ * already being translated with the same config waits for that translation
+ * instead of paying for a second, identical call.
  */
 export async function executeChain(options: ChainExecutorOptions): Promise<ChainExecutionResult> {
+  if (options.useMemory === false) {
+    return runChain(options)
+  }
+
+  const key = [
+    options.configId,
+    options.projectId ?? '',
+    options.sourceLanguage,
+    options.targetLanguage,
+    options.sourceText,
+  ].join('\0')
+
+  // A cancelled caller neither joins nor starts a shared translation
+  if (options.signal?.aborted) {
+    return cancelledResult()
+  }
+
+  const inflight = inflightTranslations.get(key)
+  if (inflight) {
+    // Stop waiting as soon as this caller cancels, rather than when the other
+    // caller's translation finishes
+    const shared = await waitUnlessAborted(inflight, options.signal)
+    if (!shared) {
+      return cancelledResult()
+    }
+    if (shared.success) {
+      return {
+        ...shared,
+        tokensUsed: { input: 0, output: 0, total: 0 },
+        totalCostUsd: 0,
+        executionPath: [],
+        source: 'memory',
+        glossaryTermsUsed: 0,
+      }
+    }
+    // The shared attempt failed; make this request's own attempt
+    return runChain(options)
+  }
+
+  const run = runChain(options)
+  inflightTranslations.set(key, run)
+  try {
+    return await run
+  } finally {
+    inflightTranslations.delete(key)
+  }
+}
+
+/**
+ * Wait for a shared translation, or resolve with `null` as soon as `signal` is aborted
+ */
+function waitUnlessAborted(
+  shared: Promise<ChainExecutionResult>,
+  signal?: AbortSignal
+): Promise<ChainExecutionResult | null> {
+  if (!signal) {
+    return shared
+  }
+  return new Promise((resolve, reject) => {
+    const onAbort = (): void => resolve(null)
+    signal.addEventListener('abort', onAbort, { once: true })
+    shared.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort))
+  })
+}
+
+/**
+ * Result for a request whose caller cancelled before it got a translation
+ */
+function cancelledResult(): ChainExecutionResult {
+  return {
+    success: false,
+    tokensUsed: { input: 0, output: 0, total: 0 },
+    totalCostUsd: 0,
+    executionPath: [],
+    finalError: 'Translation cancelled',
+    source: 'live',
+    glossaryTermsUsed: 0,
+  }
+}
+
+/**
+ * Run overrides, memory, and the fallback chain for one translation request
+ */
+async function runChain(options: ChainExecutorOptions): Promise<ChainExecutionResult> {
   const {
     configId,
     sourceText,
@@ -151,10 +278,13 @@ export async function executeChain(options: ChainExecutorOptions): Promise<Chain
     targetLanguage,
     apiKey,
     projectId,
+    apiKeys: options.apiKeys ?? new Map(),
+    runCache: options.runCache,
     glossaryTerms,
     executionPath,
     attemptedConfigs,
     retryConfig: options.retryConfig,
+    signal: options.signal,
     window,
   })
 
@@ -181,9 +311,15 @@ export async function executeChain(options: ChainExecutorOptions): Promise<Chain
     }
   }
 
+  // Look up the config that produced the translation once for both the memory
+  // cache and usage recording below
+  const finalConfig =
+    result.success && result.finalConfigId
+      ? cachedLookup(options.runCache?.configs, result.finalConfigId, getConfig)
+      : null
+
   // Cache successful translation
   if (result.success && result.translatedText && useMemory) {
-    const finalConfig = getConfig(result.finalConfigId!)
     if (finalConfig) {
       cacheTranslation(
         sourceText,
@@ -202,7 +338,6 @@ export async function executeChain(options: ChainExecutorOptions): Promise<Chain
     if (totalCostUsd > 0) {
       recordSpending(projectId, totalCostUsd)
     }
-    const finalConfig = getConfig(result.finalConfigId)
     if (finalConfig) {
       recordUsage({
         projectId,
@@ -230,18 +365,40 @@ export async function executeChain(options: ChainExecutorOptions): Promise<Chain
 // Internal Execution Logic
 // ============================================================================
 
+/**
+ * Get the API key for a provider config, fetching it from the key manager on
+ * first use and remembering it in the caller's map
+ */
+async function resolveApiKey(
+  providerConfigId: string,
+  apiKeys: Map<string, string>
+): Promise<string | null> {
+  const cached = apiKeys.get(providerConfigId)
+  if (cached) {
+    return cached
+  }
+  const key = await keyManager.getKey(providerConfigId)
+  if (key) {
+    apiKeys.set(providerConfigId, key)
+  }
+  return key
+}
+
 interface ExecuteWithFallbacksOptions {
   currentConfigId: string
   sourceText: string
   sourceLanguage: string
   targetLanguage: string
   apiKey: string
+  apiKeys: Map<string, string>
+  runCache?: ChainRunCache
   projectId?: string
   glossaryTerms: GlossaryTerm[]
   executionPath: ChainExecutionStep[]
   attemptedConfigs: Set<string>
   retryConfig?: RetryConfig
   triggeringErrorType?: ErrorType
+  signal?: AbortSignal
   window?: BrowserWindow
 }
 
@@ -255,11 +412,13 @@ async function executeWithFallbacks(
     sourceText,
     sourceLanguage,
     targetLanguage,
-    apiKey,
+    apiKeys,
+    runCache,
     glossaryTerms,
     executionPath,
     attemptedConfigs,
     retryConfig,
+    signal,
     window,
   } = options
 
@@ -276,7 +435,7 @@ async function executeWithFallbacks(
   attemptedConfigs.add(currentConfigId)
 
   // Get the config
-  const config = getConfig(currentConfigId)
+  const config = cachedLookup(runCache?.configs, currentConfigId, getConfig)
   if (!config) {
     return {
       success: false,
@@ -297,8 +456,25 @@ async function executeWithFallbacks(
     }
   }
 
+  // The caller's key belongs to the starting config. Fallbacks may use another
+  // provider, so resolve their keys once and reuse them for later chapters.
+  if (attemptedConfigs.size === 1) {
+    apiKeys.set(config.providerConfigId, options.apiKey)
+  }
+  const apiKey = await resolveApiKey(config.providerConfigId, apiKeys)
+  if (!apiKey) {
+    return {
+      success: false,
+      tokensUsed: { input: 0, output: 0, total: 0 },
+      finalError: `No API key configured for provider config ${config.providerConfigId}`,
+      finalErrorType: 'auth_error',
+    }
+  }
+
   // Get the base URL and SDK type for this provider config
-  const providerConfig = providerConfigService.getProviderConfig(config.providerConfigId)
+  const providerConfig = cachedLookup(runCache?.providerConfigs, config.providerConfigId, (id) =>
+    providerConfigService.getProviderConfig(id)
+  )
   const baseUrl = providerConfig ? providerConfigService.getBaseUrl(providerConfig) : undefined
   const sdkType = providerConfig
     ? providerConfigService.getSdkType(providerConfig)
@@ -314,7 +490,7 @@ async function executeWithFallbacks(
   )
 
   // Execute with retry
-  const startTime = Date.now()
+  const startTime = performance.now()
   const effectiveRetryConfig = retryConfig || {
     ...DEFAULT_RETRY_CONFIG,
     id: 'temp',
@@ -327,6 +503,8 @@ async function executeWithFallbacks(
 
   const { result, error, attempts, errorType } = await executeWithRetry(
     async () => {
+      // Another chapter on this provider may have just been rate limited
+      await waitForCooldown(config.providerConfigId, signal)
       const res = await provider.translate({
         modelId: config.modelId,
         systemPrompt,
@@ -335,26 +513,37 @@ async function executeWithFallbacks(
         maxTokens: config.maxTokens,
         apiKey,
         baseUrl,
+        signal,
       })
       // Providers report failures in-band (finishReason: 'error') rather than
       // throwing. Re-throw here so the retry strategy can classify and retry
       // transient errors (rate limits, timeouts) instead of giving up after one try.
+      // Throw the SDK's own error when there is one: its status, headers and
+      // retry hints are what the classifier reads.
       if (res.error || res.finishReason === 'error') {
-        throw new Error(res.error || 'Provider returned an error')
+        throw res.cause ?? new Error(res.error || 'Provider returned an error')
       }
       return res
     },
     sdkType,
     effectiveRetryConfig,
-    (attempt, err, delayMs) => {
+    (attempt, err, delayMs, retryErrorType) => {
       totalRetries++
-      logger.debug(
-        `[ChainExecutor] Retry ${attempt} for ${config.name}, waiting ${delayMs}ms: ${err}`
-      )
-    }
+      // Rate-limit delays come from the provider's retry hint (or the 60s
+      // default), so the cooldown spans the provider's actual window
+      if (retryErrorType === 'rate_limit') {
+        startCooldown(config.providerConfigId, delayMs)
+      }
+      if (logger.isLevelEnabled('debug')) {
+        logger.debug(
+          `[ChainExecutor] Retry ${attempt} for ${config.name}, waiting ${delayMs}ms: ${err}`
+        )
+      }
+    },
+    signal
   )
 
-  const durationMs = Date.now() - startTime
+  const durationMs = Math.round(performance.now() - startTime)
 
   // Handle provider result
   if (result) {
@@ -380,6 +569,16 @@ async function executeWithFallbacks(
   } else if (error) {
     lastError = error
     lastClassification = classifyError(error, sdkType)
+
+    // onRetry only covers rate limits that will be retried. When the last
+    // attempt was rate limited too, still hold off the other chapters on this
+    // provider for the window the provider asked for.
+    if (lastClassification.errorType === 'rate_limit' && lastClassification.retryAfterMs) {
+      startCooldown(
+        config.providerConfigId,
+        Math.min(lastClassification.retryAfterMs, effectiveRetryConfig.maxDelayMs)
+      )
+    }
   }
 
   // Record the failed step
@@ -400,8 +599,18 @@ async function executeWithFallbacks(
   // Emit fallback event
   const actualErrorType = lastClassification?.errorType || errorType || 'unknown'
 
+  // A cancelled run shouldn't move on to fallback configs
+  if (signal?.aborted) {
+    return {
+      success: false,
+      tokensUsed: { input: 0, output: 0, total: 0 },
+      finalError: 'Translation cancelled',
+      finalErrorType: actualErrorType,
+    }
+  }
+
   // Try to find a matching fallback
-  const fallbacks = getFallbacksForConfig(currentConfigId)
+  const fallbacks = cachedLookup(runCache?.fallbacks, currentConfigId, getFallbacksForConfig)
   const matchingFallback = findMatchingFallback(fallbacks, actualErrorType)
 
   if (matchingFallback) {
@@ -431,21 +640,45 @@ async function executeWithFallbacks(
 }
 
 /**
- * Find the first matching fallback for an error type
+ * Find the first matching fallback for an error type. Fallbacks come from
+ * getFallbacksForConfig already ordered by priority (lower = higher priority).
  */
 function findMatchingFallback(
   fallbacks: ConfigFallback[],
   errorType: ErrorType
 ): ConfigFallback | undefined {
-  // Sort by priority (lower = higher priority)
-  const sorted = [...fallbacks].sort((a, b) => a.priority - b.priority)
+  return fallbacks.find((fb) => fb.conditionType === 'any' || fb.conditionType === errorType)
+}
 
-  // Find first match
-  return sorted.find((fb) => fb.conditionType === 'any' || fb.conditionType === errorType)
+/**
+ * Look up `key` in a run cache map, loading and remembering it on a miss.
+ * Without a run cache the value is loaded every time.
+ */
+function cachedLookup<T>(
+  cache: Map<string, T> | undefined,
+  key: string,
+  load: (key: string) => T
+): T {
+  if (!cache) {
+    return load(key)
+  }
+  if (cache.has(key)) {
+    return cache.get(key) as T
+  }
+  const value = load(key)
+  cache.set(key, value)
+  return value
 }
 
 /**
- * Build user prompt from template
+ * Placeholders supported in user prompt templates
+ */
+const PROMPT_PLACEHOLDER_PATTERN = /\{\{(text|sourceLanguage|targetLanguage)\}\}/g
+
+/**
+ * Build user prompt from template.
+ * Substitutes all placeholders in one pass with a replacer function, so chapter
+ * text is never rescanned for placeholders and `$` sequences in it stay literal.
  */
 function buildUserPrompt(
   template: string,
@@ -453,10 +686,10 @@ function buildUserPrompt(
   sourceLanguage: string,
   targetLanguage: string
 ): string {
-  return template
-    .replace(/\{\{text\}\}/g, text)
-    .replace(/\{\{sourceLanguage\}\}/g, sourceLanguage)
-    .replace(/\{\{targetLanguage\}\}/g, targetLanguage)
+  return template.replace(PROMPT_PLACEHOLDER_PATTERN, (_match, name: string) => {
+    if (name === 'text') return text
+    return name === 'sourceLanguage' ? sourceLanguage : targetLanguage
+  })
 }
 
 /**
@@ -473,30 +706,42 @@ function filterRelevantGlossaryTerms(terms: GlossaryTerm[], sourceText: string):
 }
 
 /**
- * Inject glossary terms into system prompt
+ * Fixed text around the glossary term list in the system prompt
  */
-function buildSystemPromptWithGlossary(basePrompt: string, terms: GlossaryTerm[]): string {
-  if (terms.length === 0) return basePrompt
-
-  const glossarySection = `
+const GLOSSARY_PROMPT_HEADER = `
 
 ## Translation Glossary
 Use these exact translations for the following terms:
 
-${terms
-  .map((t) => {
-    let entry = `- "${t.sourceTerm}" → "${t.targetTerm}"`
-    if (t.gender) entry += ` (${t.gender})`
-    if (t.pronouns) entry += ` [${t.pronouns}]`
-    if (t.aliases.length > 0) entry += ` Also: ${t.aliases.join(', ')}`
-    if (t.context) entry += ` | Context: ${t.context}`
-    return entry
-  })
-  .join('\n')}
+`
+const GLOSSARY_PROMPT_FOOTER = `
 
 IMPORTANT: Always use these translations consistently. Pay attention to gender and pronouns.`
 
-  return basePrompt + glossarySection
+/**
+ * Format one glossary term as a prompt line
+ */
+function formatGlossaryEntry(t: GlossaryTerm): string {
+  let entry = `- "${t.sourceTerm}" → "${t.targetTerm}"`
+  if (t.gender) entry += ` (${t.gender})`
+  if (t.pronouns) entry += ` [${t.pronouns}]`
+  if (t.aliases.length > 0) entry += ` Also: ${t.aliases.join(', ')}`
+  if (t.context) entry += ` | Context: ${t.context}`
+  return entry
+}
+
+/**
+ * Inject glossary terms into system prompt
+ */
+function buildSystemPromptWithGlossary(basePrompt: string, terms: GlossaryTerm[]): string {
+  if (terms.length === 0) return basePrompt
+
+  return (
+    basePrompt +
+    GLOSSARY_PROMPT_HEADER +
+    terms.map(formatGlossaryEntry).join('\n') +
+    GLOSSARY_PROMPT_FOOTER
+  )
 }
 
 /**
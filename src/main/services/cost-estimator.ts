@@ -83,10 +83,26 @@ export function estimateCostForTokens(
   }
 }
 
+// Pricing resolved per model ID. The table is static, so the prefix scan below
+// only has to run once per model rather than on every estimate and cost record.
+const resolvedPricing = new Map<string, { input: number; output: number }>()
+
 /**
  * Get pricing for a model
  */
 export function getModelPricing(modelId: string): { input: number; output: number } {
+  let pricing = resolvedPricing.get(modelId)
+  if (!pricing) {
+    pricing = lookupModelPricing(modelId)
+    resolvedPricing.set(modelId, pricing)
+  }
+  return pricing
+}
+
+/**
+ * Find a model's pricing in MODEL_PRICING
+ */
+function lookupModelPricing(modelId: string): { input: number; output: number } {
   // Try exact match first
   if (MODEL_PRICING[modelId]) {
     return MODEL_PRICING[modelId]
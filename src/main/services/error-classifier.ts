@@ -19,6 +19,12 @@ export interface ClassificationResult {
  */
 export const DEFAULT_RETRYABLE_ERRORS: ErrorType[] = ['rate_limit', 'timeout', 'network_error']
 
+// Waits used when a rate-limit response carries no retry hint. Rate-limit
+// windows are typically a minute, so a short exponential backoff would just use
+// up every attempt inside the same window.
+const DEFAULT_RATE_LIMIT_RETRY_MS = 60000
+const DEFAULT_OVERLOADED_RETRY_MS = 30000
+
 /**
  * Classify an error into a standard error type
  * @param error The error to classify
@@ -64,10 +70,12 @@ function classifyOpenAIError(
   code?: string,
   statusCode?: number
 ): ClassificationResult {
+  const lowerMessage = message.toLowerCase()
+
   // OpenAI API error codes: https://platform.openai.com/docs/guides/error-codes
 
   // Content policy violation
-  if (code === 'content_policy_violation' || message.toLowerCase().includes('content policy')) {
+  if (code === 'content_policy_violation' || lowerMessage.includes('content policy')) {
     return {
       errorType: 'content_block',
       details: message,
@@ -76,14 +84,10 @@ function classifyOpenAIError(
   }
 
   // Rate limit
-  if (
-    code === 'rate_limit_exceeded' ||
-    statusCode === 429 ||
-    message.toLowerCase().includes('rate limit')
-  ) {
+  if (code === 'rate_limit_exceeded' || statusCode === 429 || lowerMessage.includes('rate limit')) {
     return {
       errorType: 'rate_limit',
-      retryAfterMs: extractRetryAfter(error) || 60000,
+      retryAfterMs: extractRetryAfter(error) ?? DEFAULT_RATE_LIMIT_RETRY_MS,
       details: message,
       isRetryable: true,
     }
@@ -92,8 +96,8 @@ function classifyOpenAIError(
   // Context length exceeded
   if (
     code === 'context_length_exceeded' ||
-    message.toLowerCase().includes('context length') ||
-    message.toLowerCase().includes('maximum context')
+    lowerMessage.includes('context length') ||
+    lowerMessage.includes('maximum context')
   ) {
     return {
       errorType: 'context_length',
@@ -106,8 +110,8 @@ function classifyOpenAIError(
   if (
     code === 'invalid_api_key' ||
     statusCode === 401 ||
-    message.toLowerCase().includes('incorrect api key') ||
-    message.toLowerCase().includes('invalid api key')
+    lowerMessage.includes('incorrect api key') ||
+    lowerMessage.includes('invalid api key')
   ) {
     return {
       errorType: 'auth_error',
@@ -117,7 +121,7 @@ function classifyOpenAIError(
   }
 
   // Quota exceeded
-  if (code === 'insufficient_quota' || message.toLowerCase().includes('quota')) {
+  if (code === 'insufficient_quota' || lowerMessage.includes('quota')) {
     return {
       errorType: 'quota_exceeded',
       details: message,
@@ -126,7 +130,7 @@ function classifyOpenAIError(
   }
 
   // Model not found
-  if (code === 'model_not_found' || message.toLowerCase().includes('does not exist')) {
+  if (code === 'model_not_found' || lowerMessage.includes('does not exist')) {
     return {
       errorType: 'model_unavailable',
       details: message,
@@ -136,9 +140,9 @@ function classifyOpenAIError(
 
   // Timeout
   if (
-    message.toLowerCase().includes('timeout') ||
-    message.toLowerCase().includes('etimedout') ||
-    message.toLowerCase().includes('econnreset')
+    lowerMessage.includes('timeout') ||
+    lowerMessage.includes('etimedout') ||
+    lowerMessage.includes('econnreset')
   ) {
     return {
       errorType: 'timeout',
@@ -148,9 +152,9 @@ function classifyOpenAIError(
 
   // Network error
   if (
-    message.toLowerCase().includes('network') ||
-    message.toLowerCase().includes('enotfound') ||
-    message.toLowerCase().includes('econnrefused')
+    lowerMessage.includes('network') ||
+    lowerMessage.includes('enotfound') ||
+    lowerMessage.includes('econnrefused')
   ) {
     return {
       errorType: 'network_error',
@@ -180,10 +184,12 @@ function classifyAnthropicError(
   code?: string,
   statusCode?: number
 ): ClassificationResult {
+  const lowerMessage = message.toLowerCase()
+
   // Content blocked
   if (
     code === 'content_blocked' ||
-    (message.toLowerCase().includes('content') && message.toLowerCase().includes('block'))
+    (lowerMessage.includes('content') && lowerMessage.includes('block'))
   ) {
     return {
       errorType: 'content_block',
@@ -193,14 +199,10 @@ function classifyAnthropicError(
   }
 
   // Rate limit
-  if (
-    code === 'rate_limit_error' ||
-    statusCode === 429 ||
-    message.toLowerCase().includes('rate limit')
-  ) {
+  if (code === 'rate_limit_error' || statusCode === 429 || lowerMessage.includes('rate limit')) {
     return {
       errorType: 'rate_limit',
-      retryAfterMs: extractRetryAfter(error) || 60000,
+      retryAfterMs: extractRetryAfter(error) ?? DEFAULT_RATE_LIMIT_RETRY_MS,
       details: message,
       isRetryable: true,
     }
@@ -217,9 +219,9 @@ function classifyAnthropicError(
 
   // Context length / too long
   if (
-    message.toLowerCase().includes('context') ||
-    message.toLowerCase().includes('too long') ||
-    message.toLowerCase().includes('exceeds')
+    lowerMessage.includes('context') ||
+    lowerMessage.includes('too long') ||
+    lowerMessage.includes('exceeds')
   ) {
     return {
       errorType: 'context_length',
@@ -229,17 +231,17 @@ function classifyAnthropicError(
   }
 
   // Overloaded (Anthropic-specific)
-  if (code === 'overloaded_error' || message.toLowerCase().includes('overloaded')) {
+  if (code === 'overloaded_error' || lowerMessage.includes('overloaded')) {
     return {
       errorType: 'rate_limit',
-      retryAfterMs: 30000,
+      retryAfterMs: extractRetryAfter(error) ?? DEFAULT_OVERLOADED_RETRY_MS,
       details: 'API overloaded',
       isRetryable: true,
     }
   }
 
   // Timeout
-  if (message.toLowerCase().includes('timeout')) {
+  if (lowerMessage.includes('timeout')) {
     return {
       errorType: 'timeout',
       isRetryable: true,
@@ -263,16 +265,18 @@ function classifyAnthropicError(
 }
 
 function classifyGeminiError(
-  _error: unknown,
+  error: unknown,
   message: string,
   _code?: string,
   statusCode?: number
 ): ClassificationResult {
+  const lowerMessage = message.toLowerCase()
+
   // Safety blocked
   if (
-    message.toLowerCase().includes('safety') ||
-    message.toLowerCase().includes('blocked') ||
-    message.toLowerCase().includes('harm')
+    lowerMessage.includes('safety') ||
+    lowerMessage.includes('blocked') ||
+    lowerMessage.includes('harm')
   ) {
     return {
       errorType: 'content_block',
@@ -283,13 +287,13 @@ function classifyGeminiError(
 
   // Rate limit / quota
   if (
-    message.toLowerCase().includes('resource_exhausted') ||
-    message.toLowerCase().includes('quota') ||
+    lowerMessage.includes('resource_exhausted') ||
+    lowerMessage.includes('quota') ||
     statusCode === 429
   ) {
     return {
       errorType: 'rate_limit',
-      retryAfterMs: 60000, // Default 60s for Gemini
+      retryAfterMs: extractRetryAfter(error) ?? DEFAULT_RATE_LIMIT_RETRY_MS,
       details: message,
       isRetryable: true,
     }
@@ -297,8 +301,7 @@ function classifyGeminiError(
 
   // Authentication
   if (
-    (message.toLowerCase().includes('invalid_argument') &&
-      message.toLowerCase().includes('api key')) ||
+    (lowerMessage.includes('invalid_argument') && lowerMessage.includes('api key')) ||
     statusCode === 401
   ) {
     return {
@@ -309,10 +312,7 @@ function classifyGeminiError(
   }
 
   // Model not found
-  if (
-    message.toLowerCase().includes('not found') ||
-    message.toLowerCase().includes('invalid model')
-  ) {
+  if (lowerMessage.includes('not found') || lowerMessage.includes('invalid model')) {
     return {
       errorType: 'model_unavailable',
       details: message,
@@ -322,8 +322,8 @@ function classifyGeminiError(
 
   // Context length
   if (
-    (message.toLowerCase().includes('token') && message.toLowerCase().includes('limit')) ||
-    message.toLowerCase().includes('too long')
+    (lowerMessage.includes('token') && lowerMessage.includes('limit')) ||
+    lowerMessage.includes('too long')
   ) {
     return {
       errorType: 'context_length',
@@ -359,7 +359,7 @@ function classifyGenericError(message: string, statusCode?: number): Classificat
   ) {
     return {
       errorType: 'rate_limit',
-      retryAfterMs: 60000,
+      retryAfterMs: DEFAULT_RATE_LIMIT_RETRY_MS,
       isRetryable: true,
     }
   }
@@ -496,13 +496,43 @@ function extractRetryAfter(error: unknown): number | undefined {
     if (typeof obj.retryAfter === 'number') return obj.retryAfter * 1000
     if (typeof obj.retry_after === 'number') return obj.retry_after * 1000
 
-    // Check in headers
-    if (typeof obj.headers === 'object' && obj.headers !== null) {
-      const headers = obj.headers as Record<string, unknown>
-      const retryAfter = headers['retry-after'] || headers['Retry-After']
+    // Check in headers. Current OpenAI/Anthropic SDKs expose a fetch Headers
+    // object; older ones a plain record.
+    const headers = obj.headers
+    if (typeof headers === 'object' && headers !== null) {
+      const readHeader = (name: string): unknown =>
+        headers instanceof Headers ? headers.get(name) : (headers as Record<string, unknown>)[name]
+
+      const retryAfterMs = readHeader('retry-after-ms')
+      if (typeof retryAfterMs === 'string') {
+        const ms = Number.parseFloat(retryAfterMs)
+        if (!Number.isNaN(ms)) return ms
+      }
+
+      const retryAfter = readHeader('retry-after') || readHeader('Retry-After')
       if (typeof retryAfter === 'string') {
-        const seconds = parseInt(retryAfter, 10)
+        const seconds = Number.parseFloat(retryAfter)
         if (!Number.isNaN(seconds)) return seconds * 1000
+        // Retry-After may also be an HTTP date
+        const date = Date.parse(retryAfter)
+        if (!Number.isNaN(date)) return Math.max(0, date - Date.now())
+      }
+    }
+
+    // Gemini sends no Retry-After header; the hint is a google.rpc.RetryInfo
+    // entry in the error details, with a duration such as "17s" or "0.5s"
+    if (Array.isArray(obj.errorDetails)) {
+      for (const detail of obj.errorDetails as Array<Record<string, unknown>>) {
+        const type = detail?.['@type']
+        const retryDelay = detail?.retryDelay
+        if (
+          typeof type === 'string' &&
+          type.endsWith('google.rpc.RetryInfo') &&
+          typeof retryDelay === 'string'
+        ) {
+          const seconds = Number.parseFloat(retryDelay)
+          if (!Number.isNaN(seconds)) return seconds * 1000
+        }
       }
     }
   }
@@ -121,43 +121,46 @@ export class GlossaryRunService {
       throw new Error(`No API key available for provider config: ${providerConfigId}`)
     }
 
-    // Process chapters with concurrency limit
-    const chunks: string[][] = []
-    for (let i = 0; i < chapterIds.length; i += concurrency) {
-      chunks.push(chapterIds.slice(i, i + concurrency))
-    }
-
-    for (const chunk of chunks) {
-      const promises = chunk.map((chapterId) =>
-        this.extractFromChapter(projectId, chapterId, providerConfigId, modelId, apiKey, log)
-      )
-
-      const chunkResults = await Promise.allSettled(promises)
-
-      for (let i = 0; i < chunkResults.length; i++) {
-        const chapterId = chunk[i]
-        const promiseResult = chunkResults[i]
-
-        if (promiseResult.status === 'fulfilled') {
-          const extractionResult = promiseResult.value
-          result.results.push(extractionResult)
+    // Worker pool: each worker claims the next chapter as soon as it finishes,
+    // so one slow chapter doesn't hold up a whole batch. Results are stored by
+    // chapter index to keep them in the requested order.
+    const results: ExtractionResult[] = new Array(chapterIds.length)
+    const errors: Array<string | undefined> = new Array(chapterIds.length)
+    let nextIndex = 0
+
+    const worker = async (): Promise<void> => {
+      while (nextIndex < chapterIds.length) {
+        const index = nextIndex++
+        const chapterId = chapterIds[index]
+
+        try {
+          const extractionResult = await this.extractFromChapter(
+            projectId,
+            chapterId,
+            providerConfigId,
+            modelId,
+            apiKey,
+            log
+          )
+          results[index] = extractionResult
           result.processedChapters++
           result.totalSuggestions += extractionResult.suggestionsCreated
           result.totalCostUsd += extractionResult.costUsd
           result.totalTokens += extractionResult.tokensUsed
 
           if (extractionResult.error) {
-            result.errors.push(`Chapter ${chapterId}: ${extractionResult.error}`)
+            errors[index] = `Chapter ${chapterId}: ${extractionResult.error}`
           }
-        } else {
-          result.results.push({
+        } catch (error) {
+          const message = error instanceof Error ? error.message : undefined
+          results[index] = {
             chapterId,
             suggestionsCreated: 0,
             tokensUsed: 0,
             costUsd: 0,
-            error: promiseResult.reason?.message || 'Unknown error',
-          })
-          result.errors.push(`Chapter ${chapterId}: ${promiseResult.reason?.message}`)
+            error: message || 'Unknown error',
+          }
+          errors[index] = `Chapter ${chapterId}: ${message}`
         }
 
         // Emit progress
@@ -167,6 +170,12 @@ export class GlossaryRunService {
       }
     }
 
+    const workerCount = Math.max(1, Math.min(concurrency, chapterIds.length))
+    await Promise.all(Array.from({ length: workerCount }, () => worker()))
+
+    result.results = results
+    result.errors = errors.filter((e): e is string => e !== undefined)
+
     log.info('Glossary extraction completed', {
       processedChapters: result.processedChapters,
       totalSuggestions: result.totalSuggestions,
@@ -239,7 +248,7 @@ export class GlossaryRunService {
       const prompt = this.buildExtractionPrompt(content.sourceText)
 
       // Call the API
-      const startTime = Date.now()
+      const startTime = performance.now()
       const response = await provider.translate({
         userPrompt: prompt,
         systemPrompt: this.getExtractionSystemPrompt(),
@@ -249,7 +258,7 @@ export class GlossaryRunService {
         baseUrl,
       })
 
-      const durationMs = Date.now() - startTime
+      const durationMs = Math.round(performance.now() - startTime)
 
       // Parse the response
       const terms = this.parseExtractionResponse(response.translatedText, content.sourceText)
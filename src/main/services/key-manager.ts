@@ -21,15 +21,27 @@ import {
   recordKeyUsage,
   updateApiKeyValue,
 } from '../database/repositories/apikey.repository'
-import { validateKeyForConfig } from '../providers'
+import { clearProviderClients, validateKeyForConfig } from '../providers'
 import { logger } from './logger'
 
+// How long a decrypted key stays in memory before it is decrypted again
+const DECRYPTED_KEY_TTL_MS = 5 * 60 * 1000
+
 /**
  * Key Manager class for handling API key operations
  */
 export class KeyManager {
   private rotationStrategy: KeyRotationStrategy = 'priority'
 
+  // Decrypted key values by key ID. safeStorage round-trips through the OS
+  // keychain, so decrypt once and reuse while the stored ciphertext is unchanged.
+  // Entries expire so plaintext keys don't sit in memory for the whole session.
+  private decryptedKeys = new Map<
+    string,
+    { encrypted: string; value: string; expiresAt: number }
+  >()
+  private sweepTimer: NodeJS.Timeout | null = null
+
   /**
    * Set the key rotation strategy
    */
@@ -59,8 +71,7 @@ export class KeyManager {
       return null
     }
 
-    // Decrypt the key
-    const key = this.decryptKey(encryptedKey)
+    const key = this.getDecryptedKey(keyEntry.id, encryptedKey)
     if (!key) {
       return null
     }
@@ -93,6 +104,10 @@ export class KeyManager {
   async updateKey(keyId: string, newKeyValue: string): Promise<void> {
     const encryptedKey = this.encryptKey(newKeyValue)
     updateApiKeyValue(keyId, encryptedKey)
+    this.decryptedKeys.delete(keyId)
+    // Provider clients are cached by key value, not ID; drop them all so the
+    // old key doesn't stay in memory
+    clearProviderClients()
   }
 
   /**
@@ -100,6 +115,8 @@ export class KeyManager {
    */
   async removeKey(keyId: string): Promise<void> {
     deleteApiKey(keyId)
+    this.decryptedKeys.delete(keyId)
+    clearProviderClients()
   }
 
   /**
@@ -122,7 +139,7 @@ export class KeyManager {
       return false
     }
 
-    const keyValue = this.decryptKey(encryptedKey)
+    const keyValue = this.getDecryptedKey(keyId, encryptedKey)
     if (!keyValue) {
       return false
     }
@@ -163,40 +180,51 @@ export class KeyManager {
    */
   async validateAllKeys(): Promise<KeyValidationResult[]> {
     const allKeys = listAllApiKeys()
-    const results: KeyValidationResult[] = []
-
-    // Validate keys in parallel with concurrency limit
-    const batchSize = 3
-    for (let i = 0; i < allKeys.length; i += batchSize) {
-      const batch = allKeys.slice(i, i + batchSize)
-      const batchResults = await Promise.all(
-        batch.map(async (key) => {
-          try {
-            const isValid = await this.validateStoredKey(key.id)
-            return {
-              keyId: key.id,
-              providerConfigId: key.providerConfigId,
-              label: key.label,
-              isValid,
-              error: isValid ? undefined : 'Validation failed',
-            }
-          } catch (error) {
-            return {
-              keyId: key.id,
-              providerConfigId: key.providerConfigId,
-              label: key.label,
-              isValid: false,
-              error: error instanceof Error ? error.message : String(error),
-            }
+    const results: KeyValidationResult[] = new Array(allKeys.length)
+
+    // Validate keys with a small worker pool: each worker claims the next key as
+    // soon as it finishes, so one slow provider doesn't stall the rest of a batch.
+    let nextIndex = 0
+    const worker = async (): Promise<void> => {
+      while (nextIndex < allKeys.length) {
+        const index = nextIndex++
+        const key = allKeys[index]
+        try {
+          const isValid = await this.validateStoredKey(key.id)
+          results[index] = {
+            keyId: key.id,
+            providerConfigId: key.providerConfigId,
+            label: key.label,
+            isValid,
+            error: isValid ? undefined : 'Validation failed',
           }
-        })
-      )
-      results.push(...batchResults)
+        } catch (error) {
+          results[index] = {
+            keyId: key.id,
+            providerConfigId: key.providerConfigId,
+            label: key.label,
+            isValid: false,
+            error: error instanceof Error ? error.message : String(error),
+          }
+        }
+      }
     }
 
+    const concurrency = Math.min(3, allKeys.length)
+    await Promise.all(Array.from({ length: concurrency }, () => worker()))
+
     return results
   }
 
+  /**
+   * Drop all decrypted keys, e.g. after keys were changed outside this service
+   */
+  clearKeyCache(): void {
+    this.decryptedKeys.clear()
+    this.stopSweep()
+    clearProviderClients()
+  }
+
   /**
    * Whether OS-level secure storage is available. When false, keys are only
    * obfuscated (reversible base64) rather than encrypted — common on headless
@@ -224,6 +252,54 @@ export class KeyManager {
   // Private Methods
   // ============================================================================
 
+  private getDecryptedKey(keyId: string, encryptedKey: string): string | null {
+    const now = performance.now()
+    const cached = this.decryptedKeys.get(keyId)
+    if (cached && cached.encrypted === encryptedKey && cached.expiresAt > now) {
+      return cached.value
+    }
+
+    const value = this.decryptKey(encryptedKey)
+    if (value) {
+      this.decryptedKeys.set(keyId, {
+        encrypted: encryptedKey,
+        value,
+        expiresAt: now + DECRYPTED_KEY_TTL_MS,
+      })
+      this.scheduleSweep()
+    } else {
+      this.decryptedKeys.delete(keyId)
+    }
+    return value
+  }
+
+  // Expired keys are removed on a timer as well, since a key that is never read
+  // again would otherwise stay decrypted in memory for the rest of the session
+  private scheduleSweep(): void {
+    if (this.sweepTimer) {
+      return
+    }
+    this.sweepTimer = setInterval(() => {
+      const now = performance.now()
+      for (const [keyId, entry] of this.decryptedKeys) {
+        if (entry.expiresAt <= now) {
+          this.decryptedKeys.delete(keyId)
+        }
+      }
+      if (this.decryptedKeys.size === 0) {
+        this.stopSweep()
+      }
+    }, DECRYPTED_KEY_TTL_MS)
+    this.sweepTimer.unref()
+  }
+
+  private stopSweep(): void {
+    if (this.sweepTimer) {
+      clearInterval(this.sweepTimer)
+      this.sweepTimer = null
+    }
+  }
+
   private encryptKey(keyValue: string): string {
     if (safeStorage.isEncryptionAvailable()) {
       const encrypted = safeStorage.encryptString(keyValue)
@@ -4,8 +4,19 @@
  * Provides consistent logging with correlation IDs for chain execution tracking.
  */
 
-import { appendFileSync, existsSync, mkdirSync, writeFileSync } from 'node:fs'
-import { join } from 'node:path'
+import {
+  appendFileSync,
+  copyFileSync,
+  existsSync,
+  mkdirSync,
+  readFileSync,
+  readdirSync,
+  renameSync,
+  statSync,
+  unlinkSync,
+  writeFileSync,
+} from 'node:fs'
+import { basename, dirname, join } from 'node:path'
 import { app } from 'electron'
 
 export type LogLevel = 'debug' | 'info' | 'warn' | 'error'
@@ -37,6 +48,80 @@ const LOG_LEVELS: Record<LogLevel, number> = {
   error: 3,
 }
 
+// How long file log lines are held before being appended in one write
+const FILE_FLUSH_INTERVAL_MS = 250
+
+// Flush early once this many lines are pending, so a burst of logging (e.g.
+// debug level during a large run) can't grow the buffer without bound
+const MAX_PENDING_FILE_LINES = 500
+
+// Rotated log files kept next to the live log; older ones are deleted
+const MAX_ROTATED_LOG_FILES = 5
+
+// Pending file log lines, shared by the root logger and its children since they
+// all write to the same file
+const pendingFileLines: string[] = []
+let flushTimer: NodeJS.Timeout | null = null
+let flushTarget: { path: string; maxFileSizeMb: number } | null = null
+
+function flushFileLines(): void {
+  if (flushTimer) {
+    clearTimeout(flushTimer)
+    flushTimer = null
+  }
+  if (!flushTarget || pendingFileLines.length === 0) {
+    return
+  }
+
+  const data = pendingFileLines.join('')
+  pendingFileLines.length = 0
+
+  try {
+    appendFileSync(flushTarget.path, data)
+    rotateIfNeeded(flushTarget.path, flushTarget.maxFileSizeMb)
+  } catch (error) {
+    console.error('[Logger] Failed to write to file:', error)
+  }
+}
+
+function rotateIfNeeded(logFilePath: string, maxFileSizeMb: number): void {
+  try {
+    const stats = statSync(logFilePath)
+    const sizeMb = stats.size / (1024 * 1024)
+
+    if (sizeMb > maxFileSizeMb) {
+      // Rename current log file with timestamp
+      const timestamp = new Date().toISOString().replace(/[:.]/g, '-')
+      const rotatedPath = logFilePath.replace('.log', `-${timestamp}.log`)
+      renameSync(logFilePath, rotatedPath)
+      pruneRotatedLogs(logFilePath)
+    }
+  } catch {
+    // Ignore rotation errors
+  }
+}
+
+/**
+ * Delete all but the newest rotated log files, so a long-running install
+ * doesn't accumulate logs without bound
+ */
+function pruneRotatedLogs(logFilePath: string): void {
+  const logsDir = dirname(logFilePath)
+  const prefix = `${basename(logFilePath, '.log')}-`
+
+  // Rotation suffixes are ISO timestamps, so name order is age order
+  const rotated = readdirSync(logsDir)
+    .filter((name) => name.startsWith(prefix) && name.endsWith('.log'))
+    .sort()
+
+  for (const name of rotated.slice(0, -MAX_ROTATED_LOG_FILES)) {
+    unlinkSync(join(logsDir, name))
+  }
+}
+
+// Don't lose buffered lines on shutdown
+process.on('exit', flushFileLines)
+
 /**
  * Structured Logger class
  */
@@ -56,9 +141,7 @@ export class Logger {
 
     // Set up log file path
     const logsDir = join(app.getPath('userData'), 'logs')
-    if (!existsSync(logsDir)) {
-      mkdirSync(logsDir, { recursive: true })
-    }
+    mkdirSync(logsDir, { recursive: true })
     this.logFilePath = join(logsDir, 'noveltranslate.log')
   }
 
@@ -69,6 +152,14 @@ export class Logger {
     this.minLevel = level
   }
 
+  /**
+   * Whether messages at this level are emitted. Check it before building an
+   * expensive message for a level that is usually filtered out (e.g. debug).
+   */
+  isLevelEnabled(level: LogLevel): boolean {
+    return LOG_LEVELS[level] >= LOG_LEVELS[this.minLevel]
+  }
+
   /**
    * Enable or disable file logging
    */
@@ -198,33 +289,38 @@ export class Logger {
    * Export logs to a file
    */
   exportLogs(outputPath: string, fromDate?: Date): void {
-    // Read existing log file and filter by date if needed
-    // For now, just copy the log file
-    if (existsSync(this.logFilePath)) {
-      const { readFileSync } = require('node:fs')
-      const content = readFileSync(this.logFilePath, 'utf-8')
-
-      if (fromDate) {
-        const lines = content.split('\n')
-        const filtered = lines.filter((line) => {
-          try {
-            const entry = JSON.parse(line) as LogEntry
-            return new Date(entry.timestamp) >= fromDate
-          } catch {
-            return false
-          }
-        })
-        writeFileSync(outputPath, filtered.join('\n'))
-      } else {
-        writeFileSync(outputPath, content)
-      }
+    flushFileLines()
+    if (!existsSync(this.logFilePath)) {
+      return
     }
+
+    // Without a date filter the export is a plain copy, so skip decoding the
+    // whole log into a string and writing it back out
+    if (!fromDate) {
+      copyFileSync(this.logFilePath, outputPath)
+      return
+    }
+
+    // Entry timestamps are ISO strings, which sort lexically, so compare them as
+    // strings against one precomputed bound instead of parsing a Date per line
+    const fromTimestamp = fromDate.toISOString()
+    const lines = readFileSync(this.logFilePath, 'utf-8').split('\n')
+    const filtered = lines.filter((line) => {
+      try {
+        const entry = JSON.parse(line) as LogEntry
+        return entry.timestamp >= fromTimestamp
+      } catch {
+        return false
+      }
+    })
+    writeFileSync(outputPath, filtered.join('\n'))
   }
 
   /**
    * Clear log file
    */
   clearLogs(): void {
+    pendingFileLines.length = 0
     if (existsSync(this.logFilePath)) {
       writeFileSync(this.logFilePath, '')
     }
@@ -241,7 +337,7 @@ export class Logger {
     error?: Error
   ): void {
     // Check if we should log at this level
-    if (LOG_LEVELS[level] < LOG_LEVELS[this.minLevel]) {
+    if (!this.isLevelEnabled(level)) {
       return
     }
 
@@ -296,32 +392,18 @@ export class Logger {
   }
 
   private writeToFile(entry: LogEntry): void {
-    try {
-      const line = `${JSON.stringify(entry)}\n`
-      appendFileSync(this.logFilePath, line)
-
-      // Check file size and rotate if needed
-      this.rotateIfNeeded()
-    } catch (error) {
-      console.error('[Logger] Failed to write to file:', error)
+    // Buffer lines and append them together instead of a sync write per entry
+    pendingFileLines.push(`${JSON.stringify(entry)}\n`)
+    flushTarget = { path: this.logFilePath, maxFileSizeMb: this.maxFileSizeMb }
+
+    if (pendingFileLines.length >= MAX_PENDING_FILE_LINES) {
+      flushFileLines()
+      return
     }
-  }
 
-  private rotateIfNeeded(): void {
-    try {
-      const { statSync } = require('node:fs')
-      const stats = statSync(this.logFilePath)
-      const sizeMb = stats.size / (1024 * 1024)
-
-      if (sizeMb > this.maxFileSizeMb) {
-        // Rename current log file with timestamp
-        const timestamp = new Date().toISOString().replace(/[:.]/g, '-')
-        const rotatedPath = this.logFilePath.replace('.log', `-${timestamp}.log`)
-        const { renameSync } = require('node:fs')
-        renameSync(this.logFilePath, rotatedPath)
-      }
-    } catch {
-      // Ignore rotation errors
+    if (!flushTimer) {
+      flushTimer = setTimeout(flushFileLines, FILE_FLUSH_INTERVAL_MS)
+      flushTimer.unref()
     }
   }
 }
@@ -15,7 +15,9 @@ export const DEFAULT_RETRY_CONFIG: Omit<RetryConfig, 'id' | 'configId' | 'create
   maxAttempts: 3,
   baseDelayMs: 1000,
   maxDelayMs: 60000,
-  jitterFactor: 0.2,
+  // ±50% spread on backoff delays. Delays from a provider retry hint (Retry-After,
+  // Gemini RetryInfo) are used as given, without jitter.
+  jitterFactor: 0.5,
   retryableErrors: ['rate_limit', 'timeout', 'network_error'],
 }
 
@@ -50,8 +52,10 @@ export function calculateDelay(
       delay = config.baseDelayMs * 2 ** (attempt - 1)
       break
     default: {
+      // Spread retries both ways around the exponential delay (±jitterFactor) so
+      // chapters that failed together don't all retry in the same instant
       const exponential = config.baseDelayMs * 2 ** (attempt - 1)
-      const jitter = exponential * config.jitterFactor * Math.random()
+      const jitter = exponential * config.jitterFactor * (2 * Math.random() - 1)
       delay = exponential + jitter
       break
     }
@@ -95,13 +99,15 @@ export function shouldRetry(
 }
 
 /**
- * Execute a function with retry logic
+ * Execute a function with retry logic. Once `signal` is aborted no further
+ * attempts are made, and a pending backoff delay ends early.
  */
 export async function executeWithRetry<T>(
   fn: () => Promise<T>,
   sdkType: string,
   config: RetryConfig,
-  onRetry?: (attempt: number, error: unknown, delayMs: number) => void
+  onRetry?: (attempt: number, error: unknown, delayMs: number, errorType: ErrorType) => void,
+  signal?: AbortSignal
 ): Promise<{ result?: T; error?: unknown; attempts: number; errorType?: ErrorType }> {
   let lastError: unknown
   let lastErrorType: ErrorType | undefined
@@ -121,7 +127,7 @@ export async function executeWithRetry<T>(
 
       lastErrorType = errorType
 
-      if (!retry || attempt >= config.maxAttempts) {
+      if (!retry || attempt >= config.maxAttempts || signal?.aborted) {
         break
       }
 
@@ -130,12 +136,15 @@ export async function executeWithRetry<T>(
 
       // Notify about retry
       if (onRetry) {
-        onRetry(attempt, error, delayMs)
+        onRetry(attempt, error, delayMs, errorType)
       }
 
       // Wait before retrying
       if (delayMs > 0) {
-        await sleep(delayMs)
+        await sleep(delayMs, signal)
+        if (signal?.aborted) {
+          break
+        }
       }
     }
   }
@@ -150,7 +159,7 @@ export function createRetryExecutor(config: RetryConfig) {
   return async <T>(
     fn: () => Promise<T>,
     sdkType: string,
-    onRetry?: (attempt: number, error: unknown, delayMs: number) => void
+    onRetry?: (attempt: number, error: unknown, delayMs: number, errorType: ErrorType) => void
   ) => executeWithRetry(fn, sdkType, config, onRetry)
 }
 
@@ -188,10 +197,62 @@ export function getRecommendedStrategy(errorType: ErrorType): RetryStrategyType
   }
 }
 
+// ============================================================================
+// Shared Rate-Limit Cooldowns
+// ============================================================================
+
+// Time (performance.now) until which requests sharing a key should hold off
+const cooldowns = new Map<string, number>()
+
+/**
+ * Hold off requests for `key` (e.g. a provider config) for `ms`. Concurrent
+ * chapters on the same provider then wait out a rate-limit window together
+ * instead of each sending a request that would be rejected too.
+ */
+export function startCooldown(key: string, ms: number): void {
+  const until = performance.now() + ms
+  if (until > (cooldowns.get(key) ?? 0)) {
+    cooldowns.set(key, until)
+  }
+}
+
+/**
+ * Wait until any cooldown for `key` has passed, or `signal` is aborted
+ */
+export async function waitForCooldown(key: string, signal?: AbortSignal): Promise<void> {
+  const until = cooldowns.get(key)
+  if (until === undefined) {
+    return
+  }
+  const remainingMs = until - performance.now()
+  if (remainingMs <= 0) {
+    cooldowns.delete(key)
+    return
+  }
+  await sleep(remainingMs, signal)
+}
+
 // ============================================================================
 // Helper Functions
 // ============================================================================
 
-function sleep(ms: number): Promise<void> {
-  return new Promise((resolve) => setTimeout(resolve, ms))
+/**
+ * Resolve after `ms`, or as soon as `signal` is aborted
+ */
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve) => {
+    if (signal?.aborted) {
+      resolve()
+      return
+    }
+    const onAbort = (): void => {
+      clearTimeout(timer)
+      resolve()
+    }
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort)
+      resolve()
+    }, ms)
+    signal?.addEventListener('abort', onAbort, { once: true })
+  })
 }
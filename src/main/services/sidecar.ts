@@ -105,33 +105,60 @@ function streamRequest<T>(path: string, body: unknown, onEvent: (event: T) => vo
       },
     }
 
+    const handleEvent = (eventStr: string): void => {
+      if (!eventStr.startsWith('data: ')) return
+      try {
+        const data = JSON.parse(eventStr.slice(6))
+        onEvent(data as T)
+      } catch (_e) {
+        logger.error(`[Sidecar] Failed to parse SSE event: ${eventStr.slice(0, 200)}`)
+      }
+    }
+
     const req = http.request(options, (res) => {
-      let buffer = ''
-
-      res.on('data', (chunk: Buffer) => {
-        buffer += chunk.toString()
-
-        // Process complete SSE events (data: ...\n\n)
-        const events = buffer.split('\n\n')
-        buffer = events.pop() || '' // Keep incomplete event in buffer
-
-        for (const eventStr of events) {
-          if (eventStr.startsWith('data: ')) {
-            try {
-              const data = JSON.parse(eventStr.slice(6))
-              onEvent(data as T)
-            } catch (_e) {
-              logger.error(`[Sidecar] Failed to parse SSE event: ${eventStr}`)
-            }
-          }
+      // Decode as UTF-8 across chunk boundaries so multi-byte characters in
+      // chapter text aren't split
+      res.setEncoding('utf8')
+
+      // Chunks of the event currently being received. The final parse event
+      // carries every chapter and spans many chunks, so only join them once the
+      // event is complete rather than re-scanning a growing buffer per chunk.
+      let pending: string[] = []
+      let pendingEndsWithNewline = false
+
+      res.on('data', (chunk: string) => {
+        let start = 0
+
+        // Event separator (\n\n) split across two chunks
+        if (pendingEndsWithNewline && chunk.startsWith('\n')) {
+          handleEvent(pending.join('').slice(0, -1))
+          pending = []
+          start = 1
+        }
+
+        let boundary = chunk.indexOf('\n\n', start)
+        while (boundary !== -1) {
+          pending.push(chunk.slice(start, boundary))
+          handleEvent(pending.join(''))
+          pending = []
+          start = boundary + 2
+          boundary = chunk.indexOf('\n\n', start)
+        }
+
+        if (start < chunk.length) {
+          pending.push(start === 0 ? chunk : chunk.slice(start))
+          pendingEndsWithNewline = chunk.endsWith('\n')
+        } else {
+          pendingEndsWithNewline = false
         }
       })
 
       res.on('end', () => {
-        // Process any remaining data in buffer
-        if (buffer.startsWith('data: ')) {
+        // Process any remaining data (final event without a trailing separator)
+        const remaining = pending.join('')
+        if (remaining.startsWith('data: ')) {
           try {
-            const data = JSON.parse(buffer.slice(6))
+            const data = JSON.parse(remaining.slice(6))
             onEvent(data as T)
           } catch (_e) {
             // Ignore incomplete final event
@@ -175,7 +202,9 @@ export async function startSidecar(): Promise<void> {
 
     sidecarProcess.stdout?.on('data', (data: Buffer) => {
       const output = data.toString()
-      logger.debug(`[Sidecar stdout] ${output}`)
+      if (logger.isLevelEnabled('debug')) {
+        logger.debug(`[Sidecar stdout] ${output}`)
+      }
 
       // Parse port from output
       const portMatch = output.match(/PORT:(\d+)/)
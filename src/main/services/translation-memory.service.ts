@@ -200,11 +200,9 @@ export class TranslationMemoryService {
    * Normalize text for consistent hashing
    */
   private normalizeText(text: string): string {
-    return text
-      .trim()
-      .toLowerCase()
-      .replace(/\s+/g, ' ') // Collapse whitespace
-      .replace(/[\r\n]+/g, '\n') // Normalize line endings
+    // Collapsing whitespace also folds line breaks, so one pass is enough (a
+    // separate line-ending pass after it never matched anything)
+    return text.trim().toLowerCase().replace(/\s+/g, ' ')
   }
 }
 
@@ -1,22 +1,26 @@
 import type {
-  ChainExecutionStep,
   ChapterStatus,
   TranslationConfig,
+  TranslationJobProgressEvent,
   TranslationProgressEvent,
 } from '../../shared/types'
 import {
-  archiveTranslation,
   getChapterContent,
   getConfig,
   getProjectDefaultConfig,
+  saveChapterTranslation,
   updateChapterStatus,
-  updateChapterTranslation,
 } from '../database'
 import { checkBudget } from '../database/repositories/budget.repository'
 import { getProject } from '../database/repositories/project.repository'
 import { getSettings } from '../database/repositories/settings.repository'
 import { getMainWindow } from '../window'
-import { type ChainExecutorOptions, executeChain } from './chain-executor'
+import {
+  type ChainExecutorOptions,
+  type ChainRunCache,
+  createChainRunCache,
+  executeChain,
+} from './chain-executor'
 import { estimateSingleCost } from './cost-estimator'
 import { keyManager } from './key-manager'
 import { logger } from './logger'
@@ -39,6 +43,17 @@ interface TranslationJob {
   totalCost: number
   /** Set when a hard budget limit halts the run, so remaining workers stop. */
   budgetStopped: boolean
+  /** While paused, resolves on resume or cancel so idle workers wake exactly once. */
+  resumeSignal: Promise<void> | null
+  wakeWorkers: (() => void) | null
+  /** API keys by provider config, resolved once per run for fallback configs. */
+  apiKeys: Map<string, string>
+  /** Configs and fallbacks looked up once per run instead of once per chapter. */
+  runCache: ChainRunCache
+  /** Last whole percentage sent to the renderer, so run progress is sent at most 100 times. */
+  lastReportedPercent: number
+  /** Aborted on cancel so in-flight chapters stop retrying instead of running to completion. */
+  abortController: AbortController
 }
 
 /**
@@ -77,6 +92,10 @@ export async function startTranslation(
     throw new Error(`No API key configured for provider config ${config.providerConfigId}`)
   }
 
+  // The run's starting config is already loaded; later lookups fill the cache
+  const runCache = createChainRunCache()
+  runCache.configs.set(config.id, config)
+
   // Create job
   const job: TranslationJob = {
     projectId,
@@ -91,6 +110,12 @@ export async function startTranslation(
     skippedCount: 0,
     totalCost: 0,
     budgetStopped: false,
+    resumeSignal: null,
+    wakeWorkers: null,
+    apiKeys: new Map([[config.providerConfigId, apiKey]]),
+    runCache,
+    lastReportedPercent: -1,
+    abortController: new AbortController(),
   }
 
   activeJobs.set(projectId, job)
@@ -108,8 +133,11 @@ export async function startTranslation(
  */
 export function pauseTranslation(projectId: string): void {
   const job = activeJobs.get(projectId)
-  if (job) {
+  if (job && !job.isPaused) {
     job.isPaused = true
+    job.resumeSignal = new Promise((resolve) => {
+      job.wakeWorkers = resolve
+    })
     logger.info(`[Translation] Paused for project ${projectId}`)
   }
 }
@@ -117,20 +145,14 @@ export function pauseTranslation(projectId: string): void {
 /**
  * Resume translation
  */
-export async function resumeTranslation(projectId: string): Promise<void> {
+export function resumeTranslation(projectId: string): void {
   const job = activeJobs.get(projectId)
   if (job?.isPaused) {
     job.isPaused = false
+    // Workers are still parked in processJob; wake them rather than starting a
+    // second pool alongside chapters that were in flight when we paused
+    releaseWorkers(job)
     logger.info(`[Translation] Resumed for project ${projectId}`)
-
-    // Get config and API key to continue
-    const config = getConfig(job.configId)
-    if (config) {
-      const apiKey = await keyManager.getKey(config.providerConfigId)
-      if (apiKey) {
-        processJob(job, config, apiKey)
-      }
-    }
   }
 }
 
@@ -141,6 +163,8 @@ export function cancelTranslation(projectId: string): void {
   const job = activeJobs.get(projectId)
   if (job) {
     job.isCancelled = true
+    job.abortController.abort()
+    releaseWorkers(job)
     activeJobs.delete(projectId)
     logger.info(`[Translation] Cancelled for project ${projectId}`)
   }
@@ -186,13 +210,17 @@ async function processJob(
 
   // Worker pool: keep `concurrency` chapters in flight at all times. Each worker
   // pulls the next unclaimed chapter and processes it until the queue drains or
-  // the job is paused/cancelled. This avoids the head-of-line blocking of the
-  // old fixed-batch approach, where a slow chapter stalled its whole batch.
+  // the job is cancelled. This avoids the head-of-line blocking of the old
+  // fixed-batch approach, where a slow chapter stalled its whole batch. Pausing
+  // parks workers on the job's resume signal instead of ending the pool.
   const workerCount = Math.max(1, job.concurrency)
 
   const worker = async (): Promise<void> => {
     while (true) {
-      if (job.isPaused || job.isCancelled || job.budgetStopped) return
+      while (job.isPaused && job.resumeSignal) {
+        await job.resumeSignal
+      }
+      if (job.isCancelled || job.budgetStopped) return
       // `i = job.currentIndex++` is atomic — no await between read and write.
       const i = job.currentIndex++
       if (i >= job.chapterIds.length) return
@@ -207,21 +235,33 @@ async function processJob(
         settings.enableTranslationMemory,
         settings.enableGlossaryInjection
       )
+      sendJobProgressEvent(job, false)
     }
   }
 
   await Promise.all(Array.from({ length: workerCount }, () => worker()))
 
-  // A paused job is kept alive so resumeTranslation can continue it. Anything
-  // else (complete, cancelled, budget-stopped) is finished — clean it up.
-  if (!job.isPaused) {
+  // Complete or budget-stopped — report the end of the run and clean up. A
+  // cancelled job was already removed (and may have been replaced by a new run
+  // for this project), so it must not send `done` for that projectId.
+  if (activeJobs.get(job.projectId) === job) {
+    sendJobProgressEvent(job, true)
     activeJobs.delete(job.projectId)
-    logger.info(
-      `[Translation] Finished for project ${job.projectId}: ${job.completedCount} succeeded, ` +
-        `${job.errorCount} failed, ${job.skippedCount} skipped, $${job.totalCost.toFixed(4)} total cost` +
-        (job.budgetStopped ? ' (stopped: budget limit reached)' : '')
-    )
   }
+  logger.info(
+    `[Translation] Finished for project ${job.projectId}: ${job.completedCount} succeeded, ` +
+      `${job.errorCount} failed, ${job.skippedCount} skipped, $${job.totalCost.toFixed(4)} total cost` +
+      (job.budgetStopped ? ' (stopped: budget limit reached)' : '')
+  )
+}
+
+/**
+ * Wake workers parked on a paused job (on resume or cancel)
+ */
+function releaseWorkers(job: TranslationJob): void {
+  job.wakeWorkers?.()
+  job.wakeWorkers = null
+  job.resumeSignal = null
 }
 
 /**
@@ -246,6 +286,16 @@ async function translateChapter(
       throw new Error('Chapter content not found')
     }
 
+    // Nothing to translate (e.g. an image-only page): skip it without spending a
+    // budget check or an API call on an empty prompt
+    if (!content.sourceText.trim()) {
+      const message = 'Chapter has no text to translate'
+      updateChapterStatus(chapterId, 'skipped', message)
+      job.skippedCount++
+      sendProgressEvent(job.projectId, chapterId, 'skipped', 0, message, config.id)
+      return
+    }
+
     // Budget pre-flight: estimate this chapter's cost and refuse to start if a
     // hard limit would be exceeded. Without this, a "hard limit" budget could be
     // overspent since spend is only recorded after each call completes.
@@ -274,6 +324,9 @@ async function translateChapter(
       sourceLanguage,
       targetLanguage,
       apiKey,
+      apiKeys: job.apiKeys,
+      runCache: job.runCache,
+      signal: job.abortController.signal,
       projectId: job.projectId,
       chapterId,
       useMemory,
@@ -285,21 +338,20 @@ async function translateChapter(
     const result = await executeChain(options)
 
     if (result.success && result.translatedText) {
-      // Archive existing translation if present
-      if (content.translatedText) {
-        archiveTranslation(
-          chapterId,
-          content.translatedText,
-          config.id,
-          config.name,
-          config.providerConfigId,
-          config.modelId
-        )
-      }
-
-      // Save new translation
-      updateChapterTranslation(chapterId, result.translatedText)
-      updateChapterStatus(chapterId, 'translated')
+      // Save new translation, archiving the existing one if present
+      saveChapterTranslation(
+        chapterId,
+        result.translatedText,
+        content.translatedText
+          ? {
+              previousText: content.translatedText,
+              configId: config.id,
+              configName: config.name,
+              providerConfigId: config.providerConfigId,
+              modelId: config.modelId,
+            }
+          : undefined
+      )
 
       job.completedCount++
       job.totalCost += result.totalCostUsd
@@ -310,13 +362,16 @@ async function translateChapter(
         'translated',
         100,
         `Complete (${result.source}, $${result.totalCostUsd.toFixed(4)})`,
-        result.finalConfigId,
-        result.executionPath
+        result.finalConfigId
       )
 
       logger.info(
         `[Translation] Chapter ${chapterId} completed via ${result.source}, cost: $${result.totalCostUsd.toFixed(4)}`
       )
+    } else if (job.isCancelled) {
+      // Cancelled mid-chapter: leave it to be picked up by the next run
+      updateChapterStatus(chapterId, 'pending')
+      sendProgressEvent(job.projectId, chapterId, 'pending', 0, 'Cancelled', config.id)
     } else {
       // Translation failed
       const errorMessage = result.finalError || 'Translation failed'
@@ -330,8 +385,7 @@ async function translateChapter(
         'error',
         0,
         errorMessage,
-        result.finalConfigId,
-        result.executionPath
+        result.finalConfigId
       )
 
       logger.error(
@@ -358,8 +412,7 @@ function sendProgressEvent(
   status: ChapterStatus,
   progress: number,
   message?: string,
-  configId?: string,
-  executionPath?: ChainExecutionStep[]
+  configId?: string
 ): void {
   const mainWindow = getMainWindow()
   if (mainWindow) {
@@ -370,12 +423,46 @@ function sendProgressEvent(
       progress,
       message,
       configId,
-      executionPath,
     }
     mainWindow.webContents.send('translation:progress', event)
   }
 }
 
+/**
+ * Send run-level progress to the renderer. Per-chapter events already carry
+ * each chapter's status, so this is only sent when the whole percentage
+ * changes, plus once when the run ends.
+ */
+function sendJobProgressEvent(job: TranslationJob, done: boolean): void {
+  // Events carry only the projectId, so a cancelled job's late chapters would
+  // otherwise show up as progress of the run that replaced it
+  if (activeJobs.get(job.projectId) !== job) {
+    return
+  }
+
+  const total = job.chapterIds.length
+  const processed = job.completedCount + job.errorCount + job.skippedCount
+  const percent = total > 0 ? Math.floor((processed / total) * 100) : 100
+  if (!done && percent === job.lastReportedPercent) {
+    return
+  }
+  job.lastReportedPercent = percent
+
+  const mainWindow = getMainWindow()
+  if (mainWindow) {
+    const event: TranslationJobProgressEvent = {
+      projectId: job.projectId,
+      completedCount: job.completedCount,
+      errorCount: job.errorCount,
+      skippedCount: job.skippedCount,
+      total,
+      percent,
+      done,
+    }
+    mainWindow.webContents.send('translation:jobProgress', event)
+  }
+}
+
 // ============================================================================
 // Preview Translation
 // ============================================================================
@@ -13,6 +13,7 @@ import type {
   ConfigSnapshot,
   ConfigWithFallbacks,
   CostEstimate,
+  EpubImportProgressEvent,
   FallbackConditionType,
   GlossaryRunProgressEvent,
   GlossaryRunResult,
@@ -32,6 +33,7 @@ import type {
   SidecarStatusEvent,
   TestRun,
   TranslationConfig,
+  TranslationJobProgressEvent,
   TranslationMemoryEntry,
   TranslationOverride,
   TranslationProgressEvent,
@@ -482,11 +484,21 @@ const api = {
       ipcRenderer.on('translation:progress', handler)
       return () => ipcRenderer.removeListener('translation:progress', handler)
     },
+    translationJobProgress: (callback: (event: TranslationJobProgressEvent) => void) => {
+      const handler = (_: unknown, data: TranslationJobProgressEvent) => callback(data)
+      ipcRenderer.on('translation:jobProgress', handler)
+      return () => ipcRenderer.removeListener('translation:jobProgress', handler)
+    },
     chainFallback: (callback: (event: ChainFallbackEvent) => void) => {
       const handler = (_: unknown, data: ChainFallbackEvent) => callback(data)
       ipcRenderer.on('translation:chainFallback', handler)
       return () => ipcRenderer.removeListener('translation:chainFallback', handler)
     },
+    epubImportProgress: (callback: (event: EpubImportProgressEvent) => void) => {
+      const handler = (_: unknown, data: EpubImportProgressEvent) => callback(data)
+      ipcRenderer.on('epub:import-progress', handler)
+      return () => ipcRenderer.removeListener('epub:import-progress', handler)
+    },
     sidecarStatus: (callback: (event: SidecarStatusEvent) => void) => {
       const handler = (_: unknown, data: SidecarStatusEvent) => callback(data)
       ipcRenderer.on('sidecar:status', handler)
@@ -528,7 +540,6 @@ if (process.contextIsolated) {
   try {
     contextBridge.exposeInMainWorld('electron', electronAPI)
     contextBridge.exposeInMainWorld('api', api)
-    console.log('[Preload] API exposed to renderer')
   } catch (error) {
     console.error('[Preload] Failed to expose API:', error)
   }
@@ -538,5 +549,4 @@ if (process.contextIsolated) {
   const globalWindow = window as unknown as { electron: typeof electronAPI; api: Api }
   globalWindow.electron = electronAPI
   globalWindow.api = api
-  console.log('[Preload] API attached to window (non-isolated)')
 }
@@ -1,14 +1,44 @@
-import { createRootRoute, createRoute, createRouter } from '@tanstack/react-router'
-import { ConfigBuilder } from '@/features/configs/ConfigBuilder'
-import { ConfigsPage } from '@/features/configs/ConfigsPage'
-import { GlossaryPage } from '@/features/glossary/GlossaryPage'
+import {
+  createRootRoute,
+  createRoute,
+  createRouter,
+  lazyRouteComponent,
+} from '@tanstack/react-router'
 import { HomePage } from '@/features/home/HomePage'
-import { TranslationMemoryPage } from '@/features/memory/TranslationMemoryPage'
-import { ProjectPage } from '@/features/project/ProjectPage'
-import { SettingsPage } from '@/features/settings/SettingsPage'
-import { TestingCenter } from '@/features/testing/TestingCenter'
 import { RootLayout } from './RootLayout'
 
+// Pages other than home are split into their own chunks and loaded on first
+// visit, so startup only parses the landing page. With `defaultPreload: 'intent'`
+// a page's chunk starts loading as soon as its link is hovered.
+const ProjectPage = lazyRouteComponent(
+  () => import('@/features/project/ProjectPage'),
+  'ProjectPage'
+)
+const SettingsPage = lazyRouteComponent(
+  () => import('@/features/settings/SettingsPage'),
+  'SettingsPage'
+)
+const ConfigsPage = lazyRouteComponent(
+  () => import('@/features/configs/ConfigsPage'),
+  'ConfigsPage'
+)
+const ConfigBuilder = lazyRouteComponent(
+  () => import('@/features/configs/ConfigBuilder'),
+  'ConfigBuilder'
+)
+const TestingCenter = lazyRouteComponent(
+  () => import('@/features/testing/TestingCenter'),
+  'TestingCenter'
+)
+const GlossaryPage = lazyRouteComponent(
+  () => import('@/features/glossary/GlossaryPage'),
+  'GlossaryPage'
+)
+const TranslationMemoryPage = lazyRouteComponent(
+  () => import('@/features/memory/TranslationMemoryPage'),
+  'TranslationMemoryPage'
+)
+
 // Root route with layout
 const rootRoute = createRootRoute({
   component: RootLayout,
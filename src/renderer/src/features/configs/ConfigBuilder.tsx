@@ -39,6 +39,15 @@ const CONDITION_TYPES: { value: FallbackConditionType; label: string }[] = [
   { value: 'network_error', label: 'Network Error' },
 ]
 
+/**
+ * Whether saving these form values would change the stored config
+ */
+function hasConfigChanges(config: TranslationConfig, updates: Partial<TranslationConfig>): boolean {
+  return (Object.keys(updates) as Array<keyof TranslationConfig>).some(
+    (key) => (updates[key] ?? undefined) !== (config[key] ?? undefined)
+  )
+}
+
 export function ConfigBuilder(): JSX.Element {
   const navigate = useNavigate()
   const params = useParams({ strict: false })
@@ -130,7 +139,7 @@ export function ConfigBuilder(): JSX.Element {
         })
         navigate({ to: '/configs/$id', params: { id: newConfig.id } })
       } else if (configId) {
-        await updateConfig(configId, {
+        const updates = {
           name: data.name,
           providerConfigId: data.providerConfigId,
           modelId: data.modelId,
@@ -138,7 +147,11 @@ export function ConfigBuilder(): JSX.Element {
           userPromptTemplate: data.userPromptTemplate,
           temperature: data.temperature,
           maxTokens: data.maxTokens ?? undefined,
-        })
+        }
+        // Every update writes a snapshot version; skip saves that change nothing.
+        // Only compare once this config has loaded, not against the previous one.
+        if (selectedConfig?.id === configId && !hasConfigChanges(selectedConfig, updates)) return
+        await updateConfig(configId, updates)
       }
     } catch (error) {
       console.error('Failed to save config:', error)
@@ -395,6 +408,8 @@ function FallbackChainEditor({
   const [isAdding, setIsAdding] = useState(false)
 
   const sortedFallbacks = [...fallbacks].sort((a, b) => a.priority - b.priority)
+  // Both fallback lists below resolve names per row; look them up once
+  const configNames = new Map(availableConfigs.map((c) => [c.id, c.name]))
 
   const handleAdd = async (
     fallbackConfigId: string,
@@ -423,23 +438,20 @@ function FallbackChainEditor({
         <span className="rounded bg-primary/10 px-2 py-1 font-medium text-primary">
           This Config
         </span>
-        {sortedFallbacks.map((fb) => {
-          const config = availableConfigs.find((c) => c.id === fb.fallbackConfigId)
-          return (
-            <motion.div
-              key={fb.id}
-              initial={{ opacity: 0, x: -10 }}
-              animate={{ opacity: 1, x: 0 }}
-              className="flex items-center gap-2"
-            >
-              <ArrowIcon className="h-4 w-4 text-muted-foreground" />
-              <span className="rounded bg-muted px-2 py-1">
-                {config?.name || 'Unknown'}
-                <span className="ml-1 text-xs text-muted-foreground">({fb.conditionType})</span>
-              </span>
-            </motion.div>
-          )
-        })}
+        {sortedFallbacks.map((fb) => (
+          <motion.div
+            key={fb.id}
+            initial={{ opacity: 0, x: -10 }}
+            animate={{ opacity: 1, x: 0 }}
+            className="flex items-center gap-2"
+          >
+            <ArrowIcon className="h-4 w-4 text-muted-foreground" />
+            <span className="rounded bg-muted px-2 py-1">
+              {configNames.get(fb.fallbackConfigId) || 'Unknown'}
+              <span className="ml-1 text-xs text-muted-foreground">({fb.conditionType})</span>
+            </span>
+          </motion.div>
+        ))}
         {sortedFallbacks.length === 0 && (
           <span className="text-muted-foreground">→ End (no fallbacks)</span>
         )}
@@ -448,41 +460,40 @@ function FallbackChainEditor({
       {/* Fallback list */}
       <div className="space-y-2">
         <AnimatePresence>
-          {sortedFallbacks.map((fb) => {
-            const config = availableConfigs.find((c) => c.id === fb.fallbackConfigId)
-            return (
-              <motion.div
-                key={fb.id}
-                initial={{ opacity: 0, height: 0 }}
-                animate={{ opacity: 1, height: 'auto' }}
-                exit={{ opacity: 0, height: 0 }}
-                className="flex items-center gap-2 rounded border p-2"
+          {sortedFallbacks.map((fb) => (
+            <motion.div
+              key={fb.id}
+              initial={{ opacity: 0, height: 0 }}
+              animate={{ opacity: 1, height: 'auto' }}
+              exit={{ opacity: 0, height: 0 }}
+              className="flex items-center gap-2 rounded border p-2"
+            >
+              <span className="text-sm text-muted-foreground">#{fb.priority + 1}</span>
+              <span className="flex-1 font-medium">
+                {configNames.get(fb.fallbackConfigId) || 'Unknown'}
+              </span>
+              <Select
+                value={fb.conditionType}
+                onValueChange={(value) =>
+                  handleUpdateCondition(fb.id, value as FallbackConditionType)
+                }
               >
-                <span className="text-sm text-muted-foreground">#{fb.priority + 1}</span>
-                <span className="flex-1 font-medium">{config?.name || 'Unknown'}</span>
-                <Select
-                  value={fb.conditionType}
-                  onValueChange={(value) =>
-                    handleUpdateCondition(fb.id, value as FallbackConditionType)
-                  }
-                >
-                  <SelectTrigger className="w-40">
-                    <SelectValue />
-                  </SelectTrigger>
-                  <SelectContent>
-                    {CONDITION_TYPES.map((type) => (
-                      <SelectItem key={type.value} value={type.value}>
-                        {type.label}
-                      </SelectItem>
-                    ))}
-                  </SelectContent>
-                </Select>
-                <Button variant="ghost" size="sm" onClick={() => handleDelete(fb.id)}>
-                  <TrashIcon className="h-4 w-4" />
-                </Button>
-              </motion.div>
-            )
-          })}
+                <SelectTrigger className="w-40">
+                  <SelectValue />
+                </SelectTrigger>
+                <SelectContent>
+                  {CONDITION_TYPES.map((type) => (
+                    <SelectItem key={type.value} value={type.value}>
+                      {type.label}
+                    </SelectItem>
+                  ))}
+                </SelectContent>
+              </Select>
+              <Button variant="ghost" size="sm" onClick={() => handleDelete(fb.id)}>
+                <TrashIcon className="h-4 w-4" />
+              </Button>
+            </motion.div>
+          ))}
         </AnimatePresence>
       </div>
 
@@ -521,7 +532,8 @@ function AddFallbackForm({
   const [conditionType, setConditionType] = useState<FallbackConditionType>('any')
   const [isSubmitting, setIsSubmitting] = useState(false)
 
-  const unusedConfigs = availableConfigs.filter((c) => !existingFallbackIds.includes(c.id))
+  const existingIds = new Set(existingFallbackIds)
+  const unusedConfigs = availableConfigs.filter((c) => !existingIds.has(c.id))
 
   const handleSubmit = async (): Promise<void> => {
     if (!selectedConfigId) return
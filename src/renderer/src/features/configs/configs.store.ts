@@ -131,7 +131,8 @@ export const useConfigsStore = create<ConfigsState>((set, get) => ({
   deleteConfig: async (id) => {
     try {
       await window.api.config.delete(id)
-      await get().fetchConfigs()
+      // Nothing else in the list changes, so drop the row instead of refetching
+      set({ configs: get().configs.filter((c) => c.id !== id) })
 
       if (get().selectedConfigId === id) {
         set({ selectedConfigId: null, selectedConfig: null })
@@ -145,7 +146,8 @@ export const useConfigsStore = create<ConfigsState>((set, get) => ({
   setDefaultConfig: async (id) => {
     try {
       await window.api.config.setDefault(id)
-      await get().fetchConfigs()
+      // Only the default flags change; update them in place instead of refetching
+      set({ configs: get().configs.map((c) => ({ ...c, isDefault: c.id === id })) })
     } catch (error) {
       console.error('Failed to set default config:', error)
       throw error
@@ -161,9 +163,12 @@ export const useConfigsStore = create<ConfigsState>((set, get) => ({
         conditionType
       )
 
-      // Refresh selected config
-      if (get().selectedConfigId === configId) {
-        await get().selectConfig(configId)
+      // Only the fallback list changed; patch it instead of refetching the config
+      const { selectedConfig } = get()
+      if (selectedConfig?.id === configId) {
+        set({
+          selectedConfig: { ...selectedConfig, fallbacks: [...selectedConfig.fallbacks, fallback] },
+        })
       }
 
       return fallback
@@ -177,10 +182,16 @@ export const useConfigsStore = create<ConfigsState>((set, get) => ({
     try {
       await window.api.config.updateFallback(id, updates)
 
-      // Refresh selected config
-      const selectedId = get().selectedConfigId
-      if (selectedId) {
-        await get().selectConfig(selectedId)
+      const { selectedConfig } = get()
+      if (selectedConfig) {
+        set({
+          selectedConfig: {
+            ...selectedConfig,
+            fallbacks: selectedConfig.fallbacks.map((f) =>
+              f.id === id ? { ...f, ...updates } : f
+            ),
+          },
+        })
       }
     } catch (error) {
       console.error('Failed to update fallback:', error)
@@ -192,10 +203,14 @@ export const useConfigsStore = create<ConfigsState>((set, get) => ({
     try {
       await window.api.config.deleteFallback(id)
 
-      // Refresh selected config
-      const selectedId = get().selectedConfigId
-      if (selectedId) {
-        await get().selectConfig(selectedId)
+      const { selectedConfig } = get()
+      if (selectedConfig) {
+        set({
+          selectedConfig: {
+            ...selectedConfig,
+            fallbacks: selectedConfig.fallbacks.filter((f) => f.id !== id),
+          },
+        })
       }
     } catch (error) {
       console.error('Failed to delete fallback:', error)
@@ -1,3 +1,4 @@
+import type { EpubImportProgressEvent } from '@shared/types'
 import { useNavigate } from '@tanstack/react-router'
 import { ArrowRight, BookOpen, Clock, FolderOpen, Settings, Sparkles, Upload } from 'lucide-react'
 import { motion } from 'motion/react'
@@ -16,6 +17,8 @@ export function HomePage() {
     ipc: false,
     sidecar: false,
   })
+  const [isImporting, setIsImporting] = useState(false)
+  const [importProgress, setImportProgress] = useState<EpubImportProgressEvent | null>(null)
 
   useEffect(() => {
     loadProjects()
@@ -24,11 +27,12 @@ export function HomePage() {
 
   const checkSystemStatus = async () => {
     try {
-      const pingResult = await window.api.ping()
-      setSystemStatus((s) => ({ ...s, ipc: pingResult === 'pong' }))
-
-      const sidecarHealth = await window.api.sidecar.health()
-      setSystemStatus((s) => ({ ...s, sidecar: sidecarHealth }))
+      // Query both at once and apply them in a single state update
+      const [pingResult, sidecarHealth] = await Promise.all([
+        window.api.ping(),
+        window.api.sidecar.health(),
+      ])
+      setSystemStatus({ ipc: pingResult === 'pong', sidecar: sidecarHealth })
     } catch (error) {
       console.error('System status check failed:', error)
     }
@@ -40,16 +44,23 @@ export function HomePage() {
       return
     }
 
+    // Parsing runs in the sidecar; show its progress until the import settles
+    setIsImporting(true)
+    const unsubscribe = window.api.on.epubImportProgress(setImportProgress)
     try {
       const project = await window.api.project.importEpub()
       if (!project) return
 
       toast.success(`Imported: ${project.name}`)
-      loadProjects()
+      // No need to reload the project list: the project page adds it to recents
       navigate({ to: '/project/$projectId', params: { projectId: project.id } })
     } catch (error) {
       console.error('Import failed:', error)
       toast.error(`Import failed: ${error}`)
+    } finally {
+      unsubscribe()
+      setIsImporting(false)
+      setImportProgress(null)
     }
   }
 
@@ -63,7 +74,7 @@ export function HomePage() {
             <p className="page-subtitle">Import books and manage your translation projects</p>
           </div>
           <div className="flex gap-2">
-            <Button onClick={handleImportEpub} className="gap-2">
+            <Button onClick={handleImportEpub} disabled={isImporting} className="gap-2">
               <Upload className="h-4 w-4" />
               Import EPUB
             </Button>
@@ -81,6 +92,26 @@ export function HomePage() {
 
       {/* Main Content */}
       <div className="flex-1 p-8">
+        {/* Import progress (shown once a file has been picked and parsing starts) */}
+        {importProgress && (
+          <Card className="mb-6">
+            <CardContent className="space-y-2 py-4">
+              <div className="flex items-center justify-between text-sm">
+                <span className="font-medium">Importing EPUB</span>
+                <span className="text-muted-foreground">{importProgress.message}</span>
+              </div>
+              <Progress
+                value={
+                  importProgress.total > 0
+                    ? (importProgress.current / importProgress.total) * 100
+                    : 0
+                }
+                className="h-1.5"
+              />
+            </CardContent>
+          </Card>
+        )}
+
         {/* Quick Actions */}
         <motion.div
           initial={{ opacity: 0, y: 20 }}
@@ -1,6 +1,7 @@
 import type {
   Chapter,
   ChapterContent,
+  ChapterStatus,
   ProjectConfig,
   TranslationConfig,
   TranslationOverride,
@@ -8,7 +9,7 @@ import type {
 import { useParams } from '@tanstack/react-router'
 import { BookOpen, Eye, History, Pause, Play, RotateCcw, Settings2 } from 'lucide-react'
 import { AnimatePresence, motion } from 'motion/react'
-import { useEffect, useState } from 'react'
+import { useCallback, useEffect, useMemo, useState } from 'react'
 import { toast } from 'sonner'
 import { AdvancedSection, ShowAdvancedToggle } from '@/components/ModeToggle'
 import { Button } from '@/components/ui/button'
@@ -43,6 +44,7 @@ export function ProjectPage() {
     chapters,
     isLoading,
     isTranslating,
+    jobProgress,
     loadProject,
     startTranslation,
     pauseTranslation,
@@ -256,7 +258,7 @@ export function ProjectPage() {
     }
   }
 
-  const toggleChapterSelection = (chapterId: string): void => {
+  const toggleChapterSelection = useCallback((chapterId: string): void => {
     setSelectedChapters((prev) => {
       const next = new Set(prev)
       if (next.has(chapterId)) {
@@ -266,7 +268,7 @@ export function ProjectPage() {
       }
       return next
     })
-  }
+  }, [])
 
   const selectAllPending = (): void => {
     const pendingIds = chapters
@@ -307,6 +309,12 @@ export function ProjectPage() {
     }
   }
 
+  // Recomputed only when the chapter list changes, not on every render
+  const { stats, pendingChapters, errorChapters } = useMemo(
+    () => groupChapters(chapters),
+    [chapters]
+  )
+
   if (isLoading) {
     return (
       <div className="flex h-full items-center justify-center">
@@ -323,7 +331,6 @@ export function ProjectPage() {
     )
   }
 
-  const stats = getChapterStats(chapters)
   const progressPercent = chapters.length > 0 ? (stats.translated / chapters.length) * 100 : 0
   const selectedConfig = configs.find((c) => c.id === selectedConfigId)
   const activeChapter = chapters.find((chapter) => chapter.id === activeChapterId)
@@ -410,7 +417,10 @@ export function ProjectPage() {
           {/* Progress bar */}
           <div className="mt-4">
             <div className="mb-2 flex justify-between text-sm">
-              <span className="text-muted-foreground">Translation Progress</span>
+              <span className="text-muted-foreground">
+                Translation Progress
+                {isTranslating && jobProgress && ` · current run ${jobProgress.percent}%`}
+              </span>
               <span className="font-medium">
                 {stats.translated} / {chapters.length} chapters
               </span>
@@ -577,7 +587,7 @@ export function ProjectPage() {
               </TabsContent>
               <TabsContent value="pending" className="m-0 flex-1 overflow-hidden">
                 <ChapterList
-                  chapters={chapters.filter((c) => c.status === 'pending')}
+                  chapters={pendingChapters}
                   selectedChapters={selectedChapters}
                   onToggleSelection={toggleChapterSelection}
                   activeChapterId={activeChapterId}
@@ -587,7 +597,7 @@ export function ProjectPage() {
               </TabsContent>
               <TabsContent value="error" className="m-0 flex-1 overflow-hidden">
                 <ChapterList
-                  chapters={chapters.filter((c) => c.status === 'error')}
+                  chapters={errorChapters}
                   selectedChapters={selectedChapters}
                   onToggleSelection={toggleChapterSelection}
                   activeChapterId={activeChapterId}
@@ -663,12 +673,27 @@ export function ProjectPage() {
   )
 }
 
-function getChapterStats(chapters: Chapter[]) {
-  return {
-    pending: chapters.filter((c) => c.status === 'pending').length,
-    translating: chapters.filter((c) => c.status === 'translating').length,
-    translated: chapters.filter((c) => c.status === 'translated').length,
-    error: chapters.filter((c) => c.status === 'error').length,
-    skipped: chapters.filter((c) => c.status === 'skipped').length,
+/**
+ * Count chapters by status and collect the pending and errored ones for their
+ * tabs, in one pass over the list
+ */
+function groupChapters(chapters: Chapter[]) {
+  const stats: Record<ChapterStatus, number> = {
+    pending: 0,
+    translating: 0,
+    translated: 0,
+    error: 0,
+    skipped: 0,
+  }
+  const pendingChapters: Chapter[] = []
+  const errorChapters: Chapter[] = []
+  for (const chapter of chapters) {
+    stats[chapter.status]++
+    if (chapter.status === 'pending') {
+      pendingChapters.push(chapter)
+    } else if (chapter.status === 'error') {
+      errorChapters.push(chapter)
+    }
   }
+  return { stats, pendingChapters, errorChapters }
 }
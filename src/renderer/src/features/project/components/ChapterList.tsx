@@ -1,7 +1,7 @@
 import type { Chapter } from '@shared/types'
 import { useVirtualizer } from '@tanstack/react-virtual'
 import { Check } from 'lucide-react'
-import { useRef } from 'react'
+import { memo, useRef } from 'react'
 import { cn } from '@/lib/utils'
 import { StatusIcon } from './StatusIcon'
 
@@ -63,8 +63,8 @@ export function ChapterList({
               <ChapterItem
                 chapter={chapter}
                 isSelected={selectedChapters.has(chapter.id)}
-                onToggleSelection={() => onToggleSelection(chapter.id)}
-                onSelectChapter={() => onSelectChapter(chapter.id)}
+                onToggleSelection={onToggleSelection}
+                onSelectChapter={onSelectChapter}
                 isActive={activeChapterId === chapter.id}
                 showSelection={showSelection}
               />
@@ -79,13 +79,15 @@ export function ChapterList({
 interface ChapterItemProps {
   chapter: Chapter
   isSelected: boolean
-  onToggleSelection: () => void
-  onSelectChapter: () => void
+  onToggleSelection: (id: string) => void
+  onSelectChapter: (id: string) => void
   isActive: boolean
   showSelection: boolean
 }
 
-function ChapterItem({
+// Memoized so a status change re-renders only the affected row; callbacks take
+// the chapter ID rather than being bound per row, keeping props stable.
+const ChapterItem = memo(function ChapterItem({
   chapter,
   isSelected,
   onToggleSelection,
@@ -100,7 +102,7 @@ function ChapterItem({
         isSelected && 'bg-primary/10',
         isActive && 'ring-1 ring-primary/30'
       )}
-      onClick={onSelectChapter}
+      onClick={() => onSelectChapter(chapter.id)}
     >
       {showSelection && (
         <div
@@ -110,7 +112,7 @@ function ChapterItem({
           )}
           onClick={(event) => {
             event.stopPropagation()
-            onToggleSelection()
+            onToggleSelection(chapter.id)
           }}
         >
           {isSelected && <Check className="h-3 w-3" />}
@@ -122,4 +124,4 @@ function ChapterItem({
       </div>
     </div>
   )
-}
+})
@@ -5,15 +5,16 @@ interface StatusIconProps {
   status: ChapterStatus
 }
 
+// Built once: returning the same element instances lets React skip reconciling
+// the icon for every row re-render
+const DEFAULT_ICON = <FileText className="h-4 w-4 shrink-0 text-muted-foreground" />
+
+const STATUS_ICONS: Partial<Record<ChapterStatus, JSX.Element>> = {
+  translated: <CheckCircle className="h-4 w-4 shrink-0 text-green-600" />,
+  error: <AlertCircle className="h-4 w-4 shrink-0 text-destructive" />,
+  translating: <Clock className="h-4 w-4 shrink-0 animate-pulse text-yellow-600" />,
+}
+
 export function StatusIcon({ status }: StatusIconProps): JSX.Element {
-  switch (status) {
-    case 'translated':
-      return <CheckCircle className="h-4 w-4 shrink-0 text-green-600" />
-    case 'error':
-      return <AlertCircle className="h-4 w-4 shrink-0 text-destructive" />
-    case 'translating':
-      return <Clock className="h-4 w-4 shrink-0 animate-pulse text-yellow-600" />
-    default:
-      return <FileText className="h-4 w-4 shrink-0 text-muted-foreground" />
-  }
+  return STATUS_ICONS[status] ?? DEFAULT_ICON
 }
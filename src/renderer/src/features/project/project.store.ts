@@ -1,4 +1,10 @@
-import type { ChainFallbackEvent, Chapter, Project, TranslationProgressEvent } from '@shared/types'
+import type {
+  ChainFallbackEvent,
+  Chapter,
+  Project,
+  TranslationJobProgressEvent,
+  TranslationProgressEvent,
+} from '@shared/types'
 import { create } from 'zustand'
 
 interface ProjectState {
@@ -11,7 +17,7 @@ interface ProjectState {
   // Translation state
   isTranslating: boolean
   isPaused: boolean
-  translationProgress: TranslationProgressEvent | null
+  jobProgress: TranslationJobProgressEvent | null
   lastFallbackEvent: ChainFallbackEvent | null
 
   // Recent projects list
@@ -28,7 +34,6 @@ interface ProjectState {
   // Translation actions
   setTranslating: (translating: boolean) => void
   setPaused: (paused: boolean) => void
-  updateTranslationProgress: (progress: TranslationProgressEvent) => void
   updateChapterStatus: (chapterId: string, status: Chapter['status']) => void
 
   // Async actions (call IPC)
@@ -56,7 +61,7 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
   // Translation state
   isTranslating: false,
   isPaused: false,
-  translationProgress: null,
+  jobProgress: null,
   lastFallbackEvent: null,
 
   // Setters
@@ -75,24 +80,14 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
   // Translation setters
   setTranslating: (translating) => set({ isTranslating: translating }),
   setPaused: (paused) => set({ isPaused: paused }),
-  updateTranslationProgress: (progress) => {
-    set({ translationProgress: progress })
-
-    // Update chapter status if we have chapter info
-    if (progress.chapterId) {
-      const { chapters } = get()
-      const updatedChapters = chapters.map((ch) => {
-        if (ch.id === progress.chapterId) {
-          return { ...ch, status: progress.status === 'translating' ? 'translating' : ch.status }
-        }
-        return ch
-      })
-      set({ chapters: updatedChapters })
-    }
-  },
   updateChapterStatus: (chapterId, status) => {
     const { chapters } = get()
-    const updatedChapters = chapters.map((ch) => (ch.id === chapterId ? { ...ch, status } : ch))
+    const index = chapters.findIndex((ch) => ch.id === chapterId)
+    if (index === -1 || chapters[index].status === status) return
+
+    // Replace only the changed chapter so other rows keep their identity
+    const updatedChapters = chapters.slice()
+    updatedChapters[index] = { ...chapters[index], status }
     set({ chapters: updatedChapters })
   },
 
@@ -119,11 +114,16 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
       return
     }
 
-    set({ isLoading: true, error: null })
+    // Coming back to the project already in the store: keep showing it and
+    // refresh in the background instead of rebuilding the page behind a spinner
+    const isRevisit = get().currentProject?.id === id
+    set({ isLoading: !isRevisit, error: null })
     try {
-      const project = await window.api.project.get(id)
+      const [project, chapters] = await Promise.all([
+        window.api.project.get(id),
+        window.api.chapter.list(id),
+      ])
       if (project) {
-        const chapters = await window.api.chapter.list(id)
         set({ currentProject: project, chapters, isLoading: false })
         get().addRecentProject(project)
       } else {
@@ -169,7 +169,7 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
       throw new Error('API not available')
     }
 
-    set({ isTranslating: true, isPaused: false, error: null })
+    set({ isTranslating: true, isPaused: false, jobProgress: null, error: null })
     try {
       await window.api.translation.start(projectId, chapterIds, configId)
     } catch (error) {
@@ -205,7 +205,7 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
 
     try {
       await window.api.translation.cancel(projectId)
-      set({ isTranslating: false, isPaused: false, translationProgress: null })
+      set({ isTranslating: false, isPaused: false, jobProgress: null })
     } catch (error) {
       console.error('Failed to cancel translation:', error)
     }
@@ -215,33 +215,74 @@ export const useProjectStore = create<ProjectState>((set, get) => ({
   subscribeToEvents: () => {
     if (!window.api) return () => {}
 
+    // With several workers, progress events can arrive faster than is worth
+    // rendering. Queue them and apply once per frame, keeping only the latest
+    // event per chapter (a chapter's terminal event always supersedes earlier ones).
+    const pendingProgress = new Map<string, TranslationProgressEvent>()
+    let frameId: number | null = null
+
+    // A chapter event only changes that chapter's row (the run as a whole ends
+    // with the job progress event below), so apply the frame's events in one set()
+    const flushProgress = (): void => {
+      frameId = null
+      const { chapters } = get()
+      let updatedChapters: Chapter[] | null = null
+      for (let i = 0; i < chapters.length; i++) {
+        const event = pendingProgress.get(chapters[i].id)
+        if (event && event.status !== chapters[i].status) {
+          updatedChapters ??= chapters.slice()
+          updatedChapters[i] = { ...chapters[i], status: event.status }
+        }
+      }
+      pendingProgress.clear()
+      if (updatedChapters) {
+        set({ chapters: updatedChapters })
+      }
+    }
+
     // Subscribe to translation progress events
     const unsubProgress = window.api.on.translationProgress((event) => {
-      get().updateTranslationProgress(event)
-
-      // Handle completion (translated = done, skipped = cancelled/skipped)
-      if (event.progress >= 100 || event.status === 'error') {
-        set({ isTranslating: false, isPaused: false })
-        // Reload chapters to get updated statuses
-        const { currentProject } = get()
-        if (currentProject) {
-          window.api.chapter.list(currentProject.id).then((chapters) => {
-            set({ chapters })
-          })
-        }
+      pendingProgress.delete(event.chapterId)
+      pendingProgress.set(event.chapterId, event)
+      if (frameId === null) {
+        frameId = requestAnimationFrame(flushProgress)
+      }
+    })
+
+    // Run-level progress arrives at most once per whole percent, plus a final
+    // event when the run ends
+    const unsubJobProgress = window.api.on.translationJobProgress((event) => {
+      // Runs for other projects can still be going in the background
+      const { currentProject } = get()
+      if (event.projectId !== currentProject?.id) {
+        return
+      }
+
+      if (!event.done) {
+        set({ jobProgress: event })
+        return
       }
+
+      set({ isTranslating: false, isPaused: false, jobProgress: null })
+      // Reload chapters once to pick up error messages and final statuses
+      window.api.chapter.list(currentProject.id).then((chapters) => {
+        set({ chapters })
+      })
     })
 
     // Subscribe to fallback events
     const unsubFallback = window.api.on.chainFallback((event) => {
       set({ lastFallbackEvent: event })
-      console.log('[Translation] Fallback triggered:', event)
     })
 
     // Return cleanup function
     return () => {
       unsubProgress()
+      unsubJobProgress()
       unsubFallback()
+      if (frameId !== null) {
+        cancelAnimationFrame(frameId)
+      }
     }
   },
 }))
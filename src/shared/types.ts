@@ -727,7 +727,24 @@ export interface TranslationProgressEvent {
   progress: number // 0-100
   message?: string
   configId?: string
-  executionPath?: ChainExecutionStep[]
+}
+
+/** Run-level progress, sent when the whole percentage changes and when the run ends */
+export interface TranslationJobProgressEvent {
+  projectId: string
+  completedCount: number
+  errorCount: number
+  skippedCount: number
+  total: number
+  percent: number // 0-100, whole numbers
+  done: boolean
+}
+
+/** EPUB parsing progress while a project is being imported */
+export interface EpubImportProgressEvent {
+  current: number
+  total: number
+  message: string
 }
 
 export interface ChainFallbackEvent {